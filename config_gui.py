@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import csv
+import functools
 import json
 import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser, scrolledtext
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 try:
     from PIL import Image, ImageDraw, ImageFont, ImageTk
@@ -17,6 +22,7 @@ except ImportError as exc:  # pragma: no cover - handled at runtime
 DEFAULT_CONFIG_PATH = Path("config/content_config.json")
 PREVIEW_MAX_WIDTH = 900
 PREVIEW_MAX_HEIGHT = 600
+PREVIEW_THROTTLE_S = 0.25
 MAX_CUSTOM_FIELDS = 5
 BASE_DEFAULT_VALUES = {
     "background_image": "./background/sample.png",
@@ -47,6 +53,51 @@ SMTP_CONFIG_PATH = Path("config/smtp_config.json")
 DEBUG_CONFIG_PATH = Path("config/debug_mode.json")
 
 
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb(value: str) -> Tuple[int, int, int]:
+    """Convert '#RRGGBB' or '#RGB' to an RGB tuple; memoized since the preview
+    re-resolves the same handful of colors on every frame."""
+    digits = value.lstrip("#")
+    if len(digits) == 3:
+        digits = "".join(ch * 2 for ch in digits)
+    return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)
+
+
+_HEX_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\Z")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_color(value: str) -> Tuple[int, int, int]:
+    """Resolve a '#RGB'/'#RRGGBB' string to an RGB tuple, black on anything else."""
+    if isinstance(value, str) and _HEX_COLOR_RE.match(value):
+        return _hex_to_rgb(value)
+    return 0, 0, 0
+
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(
+            obj, indent=2, ensure_ascii=False, separators=(",", ": ")
+        ).encode("utf-8")
+
+
+def _read_json(path):
+    """Decode a JSON file from a single bytes read instead of incremental text-mode parsing."""
+    with open(path, "rb") as fh:
+        return _json_loads(fh.read())
+
+
 class ConfigGUI:
     """Tkinter GUI for editing certificate content configuration files."""
 
@@ -59,6 +110,31 @@ class ConfigGUI:
         self.preview_after_id: Optional[str] = None
         self.preview_image = None
         self.preview_photo = None
+        self._background_cache: Dict[Tuple, Image.Image] = {}
+        self._background_placeholder: Optional[Image.Image] = None
+        self._warned_missing_background: Optional[str] = None
+        self._font_cache: Dict[Tuple, Tuple[ImageFont.ImageFont, int]] = {}
+        self._text_width_cache: Dict[Tuple, int] = {}
+        self._overlay_scratch: Optional[Image.Image] = None
+        self._last_canvas_size: Optional[Tuple[int, int]] = None
+        self._preview_dirty = False
+        self._last_preview_signature: Optional[Tuple] = None
+        self._last_render_ts = 0.0
+        self._preview_pending = False
+        # Parsed once on variable writes so each render reads plain scalars.
+        self._split_threshold: Optional[int] = 24
+        self._split_gap_mm: Optional[float] = None
+        # Single worker so renders are serialized; results are marshalled back
+        # to the Tk main thread via root.after.
+        self._preview_executor = ThreadPoolExecutor(max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._preview_render_seq = 0
+        self._preview_canvas_item: Optional[int] = None
+        self._preview_text_item: Optional[int] = None
+        self._preview_bg_photo = None
+        self._preview_bg_key: Optional[Tuple] = None
+        self._parse_cache: Dict[Tuple[str, str], Union[int, float]] = {}
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
         self.visible_custom_fields = 0
         self.content_form_frame: Optional[ttk.Frame] = None
         self.content_canvas: Optional[tk.Canvas] = None
@@ -93,16 +169,27 @@ class ConfigGUI:
         self.participants_path = Path("participants.csv")
         self.participants_path_var = tk.StringVar(value=str(self.participants_path))
         self.participants_columns: List[str] = []
+        self._participants_col_index: Dict[str, int] = {}
         self.participants_tree: Optional[ttk.Treeview] = None
         self.participants_status_var = tk.StringVar(value="")
         self.participant_entry_vars: Dict[str, tk.StringVar] = {}
+        self.participants_autosave_var = tk.BooleanVar(value=False)
         self.participants_form_frame: Optional[ttk.Frame] = None
+        self._participant_form_columns: Optional[Tuple[str, ...]] = None
+
+        # Key-level entry validators; registered once and shared by every
+        # numeric entry so garbage keystrokes never reach the StringVars.
+        self._int_vcmd = (self.root.register(self._validate_int_entry), "%P")
+        self._float_vcmd = (self.root.register(self._validate_float_entry), "%P")
 
+        self._suspend_traces = False
         self._attach_var_traces()
 
         self._build_layout()
         self._load_initial_configs()
-        self.schedule_preview_update()
+        # Let the window map before the first render is queued; the initial
+        # background decode then happens behind a visible UI.
+        self.root.after_idle(self.schedule_preview_update)
 
     # ------------------------------------------------------------------ UI setup
     def _build_layout(self) -> None:
@@ -131,11 +218,16 @@ class ConfigGUI:
         self.notebook.add(smtp_frame, text="SMTP Server")
         self.notebook.add(debug_frame, text="Debug Mode")
 
+        # Only the initially visible tab is built eagerly; the others are
+        # populated (and their configs loaded) on first selection, which cuts
+        # hundreds of Tcl widget-creation calls from startup.
         self._build_content_tab(content_frame)
-        self._build_participants_tab(participants_frame)
-        self._build_email_tab(email_frame)
-        self._build_smtp_tab(smtp_frame)
-        self._build_debug_tab(debug_frame)
+        self._pending_tab_builders = {
+            str(participants_frame): (self._build_participants_tab, self.load_participants),
+            str(email_frame): (self._build_email_tab, self.load_email_config),
+            str(smtp_frame): (self._build_smtp_tab, self.load_smtp_config),
+            str(debug_frame): (self._build_debug_tab, self.load_debug_config),
+        }
 
         # Preview canvas --------------------------------------------------------
         self.preview_frame = preview_frame
@@ -150,7 +242,16 @@ class ConfigGUI:
         )
         self.preview_canvas.pack(fill="both", expand=True, pady=(5, 0))
 
-        self.notebook.bind("<<NotebookTabChanged>>", lambda *_: self._update_preview_visibility())
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._update_preview_visibility()
+
+    def _on_tab_changed(self, *_args) -> None:
+        tab_id = self.notebook.select()
+        pending = self._pending_tab_builders.pop(tab_id, None)
+        if pending is not None:
+            builder, loader = pending
+            builder(self.notebook.nametowidget(tab_id))
+            loader()
         self._update_preview_visibility()
 
     def _build_content_tab(self, frame: ttk.Frame) -> None:
@@ -230,23 +331,23 @@ class ConfigGUI:
         )
         row += 2
 
-        self._build_simple_entry(frame, row, "Font Size (pt)", "font_size")
+        self._build_simple_entry(frame, row, "Font Size (pt)", "font_size", kind="int")
         row += 1
-        self._build_simple_entry(frame, row, "Text Baseline Y (mm)", "text_y")
+        self._build_simple_entry(frame, row, "Text Baseline Y (mm)", "text_y", kind="float")
         row += 1
-        self._build_simple_entry(frame, row, "Long Name Threshold (chars)", "long_name_threshold")
+        self._build_simple_entry(frame, row, "Long Name Threshold (chars)", "long_name_threshold", kind="int")
         row += 1
-        self._build_simple_entry(frame, row, "Long Name Font Size (pt)", "long_name_font_size")
+        self._build_simple_entry(frame, row, "Long Name Font Size (pt)", "long_name_font_size", kind="int")
         row += 1
-        self._build_simple_entry(frame, row, "Long Name Baseline Y (mm)", "long_name_text_y")
+        self._build_simple_entry(frame, row, "Long Name Baseline Y (mm)", "long_name_text_y", kind="float")
         row += 1
-        self._build_simple_entry(frame, row, "Split Name Threshold (chars)", "split_name_threshold")
+        self._build_simple_entry(frame, row, "Split Name Threshold (chars)", "split_name_threshold", kind="int")
         row += 1
-        self._build_simple_entry(frame, row, "Split Line Gap (mm)", "split_name_line_gap")
+        self._build_simple_entry(frame, row, "Split Line Gap (mm)", "split_name_line_gap", kind="float")
         row += 1
-        self._build_simple_entry(frame, row, "Split Name Font Size (pt)", "split_name_font_size")
+        self._build_simple_entry(frame, row, "Split Name Font Size (pt)", "split_name_font_size", kind="float")
         row += 1
-        self._build_simple_entry(frame, row, "Split Name Baseline Y (mm)", "split_name_text_y")
+        self._build_simple_entry(frame, row, "Split Name Baseline Y (mm)", "split_name_text_y", kind="float")
         row += 1
 
         ttk.Label(frame, text="Orientation").grid(row=row, column=0, sticky="w", pady=(10, 0))
@@ -265,6 +366,8 @@ class ConfigGUI:
         color_frame.grid(row=row, column=1, columnspan=2, sticky="ew", pady=(10, 0))
         color_entry = ttk.Entry(color_frame, textvariable=self.vars["text_color"], width=12)
         color_entry.pack(side="left", fill="x", expand=True)
+        color_entry.bind("<FocusOut>", self._on_var_write)
+        color_entry.bind("<Return>", self._on_var_write)
         ttk.Button(color_frame, text="Pick...", command=self.choose_text_color).pack(side="left", padx=(5, 0))
         row += 1
 
@@ -315,11 +418,17 @@ class ConfigGUI:
                 filetypes=[("TrueType font", "*.ttf;*.otf"), ("All files", "*.*")],
             )
             row += 2
-            self._build_simple_entry(frame, row, f"Custom Field {index} Font Size (pt)", f"custom_field_{index}_font_size")
+            self._build_simple_entry(
+                frame, row, f"Custom Field {index} Font Size (pt)", f"custom_field_{index}_font_size", kind="float"
+            )
             row += 1
-            self._build_simple_entry(frame, row, f"Custom Field {index} Text X (mm)", f"custom_field_{index}_text_x")
+            self._build_simple_entry(
+                frame, row, f"Custom Field {index} Text X (mm)", f"custom_field_{index}_text_x", kind="float"
+            )
             row += 1
-            self._build_simple_entry(frame, row, f"Custom Field {index} Text Y (mm)", f"custom_field_{index}_text_y")
+            self._build_simple_entry(
+                frame, row, f"Custom Field {index} Text Y (mm)", f"custom_field_{index}_text_y", kind="float"
+            )
             row += 1
             self._build_color_entry(frame, row, f"Custom Field {index} Text Color", f"custom_field_{index}_text_color")
             row += 1
@@ -622,6 +731,9 @@ class ConfigGUI:
 
     def _set_participants_columns(self, columns: List[str]) -> None:
         self.participants_columns = [col for col in columns if col]
+        self._participants_col_index = {
+            col: idx for idx, col in enumerate(self.participants_columns)
+        }
 
         if self.participants_tree is not None:
             self.participants_tree["columns"] = self.participants_columns
@@ -648,22 +760,47 @@ class ConfigGUI:
         if desired_columns == current_columns:
             return
 
+        old_index = self._participants_col_index
         existing_rows = []
         if self.participants_tree is not None:
-            for item in self.participants_tree.get_children():
-                values = self.participants_tree.item(item, "values")
-                row_map = {}
-                for idx, column in enumerate(current_columns):
-                    row_map[column] = values[idx] if idx < len(values) else ""
-                existing_rows.append(row_map)
+            item_values = self.participants_tree.item
+            existing_rows = [
+                item_values(item, "values") for item in self.participants_tree.get_children()
+            ]
 
         self._set_participants_columns(desired_columns)
 
         if self.participants_tree is not None and existing_rows:
+            source_indices = [old_index.get(column) for column in self.participants_columns]
             self.participants_tree.delete(*self.participants_tree.get_children())
-            for row_map in existing_rows:
-                values = [row_map.get(column, "") for column in self.participants_columns]
-                self.participants_tree.insert("", "end", values=values)
+            self._bulk_insert_participants(
+                [
+                    values[idx] if idx is not None and idx < len(values) else ""
+                    for idx in source_indices
+                ]
+                for values in existing_rows
+            )
+
+    def _bulk_insert_participants(self, rows) -> int:
+        """Insert many rows while the tree is unmapped so Tk skips per-row relayout."""
+        tree = self.participants_tree
+        if tree is None:
+            return 0
+        count = 0
+        was_gridded = bool(tree.grid_info())
+        if was_gridded:
+            tree.grid_remove()
+        try:
+            insert = tree.insert
+            for values in rows:
+                insert("", "end", values=values)
+                count += 1
+        finally:
+            if was_gridded:
+                tree.grid()
+                # One layout pass for the whole batch rather than per insert.
+                tree.update_idletasks()
+        return count
 
     def _resolve_visible_custom_fields_from_config(self) -> int:
         highest_visible = 0
@@ -707,6 +844,13 @@ class ConfigGUI:
         if self.participants_form_frame is None:
             return
 
+        # Most CSV loads keep the same columns; rebuilding the form then would
+        # just destroy and recreate identical widgets.
+        columns_signature = tuple(self.participants_columns)
+        if columns_signature == self._participant_form_columns:
+            return
+        self._participant_form_columns = columns_signature
+
         for child in self.participants_form_frame.winfo_children():
             child.destroy()
 
@@ -749,6 +893,12 @@ class ConfigGUI:
             text="Add Participant",
             command=self.add_participant,
         ).grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=(10, 5))
+        row += 1
+        ttk.Checkbutton(
+            self.participants_form_frame,
+            text="Append added rows to the CSV immediately",
+            variable=self.participants_autosave_var,
+        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=(0, 5))
         self.participants_form_frame.columnconfigure(1, weight=1)
 
     def _update_preview_visibility(self) -> None:
@@ -761,25 +911,86 @@ class ConfigGUI:
         if should_show:
             if self.preview_frame.winfo_manager() != "pack":
                 self.preview_frame.pack(side="right", fill="both", expand=True, padx=(15, 0))
+            if self._preview_dirty:
+                self._preview_dirty = False
+                self.schedule_preview_update()
         else:
             self.preview_frame.pack_forget()
 
     def _attach_var_traces(self) -> None:
-        for var in self.vars.values():
-            var.trace_add("write", lambda *_args: self.schedule_preview_update())
-        self.preview_name_var.trace_add("write", lambda *_args: self.schedule_preview_update())
-        for var in self.preview_custom_field_vars.values():
-            var.trace_add("write", lambda *_args: self.schedule_preview_update())
+        # text_color is excluded: typing a hex color produces up to seven
+        # intermediate invalid values, so its entry rerenders on commit
+        # (FocusOut/Return/color picker) instead of per keystroke.
+        traced_vars = [var for key, var in self.vars.items() if key != "text_color"]
+        for var in (*traced_vars, self.preview_name_var, *self.preview_custom_field_vars.values()):
+            var.trace_add("write", self._on_var_write)
         for index in range(1, MAX_CUSTOM_FIELDS + 1):
-            self.vars[f"custom_field_{index}_name"].trace_add(
-                "write", lambda *_args: self._sync_participant_columns_with_config()
+            self.vars[f"custom_field_{index}_name"].trace_add("write", self._on_custom_field_name_write)
+        # Split settings get an extra trace so the parse happens once per
+        # edit instead of once per preview render.
+        for key in ("split_name_threshold", "split_name_line_gap"):
+            self.vars[key].trace_add("write", self._on_split_setting_write)
+        self._refresh_split_settings()
+
+    def _on_var_write(self, *_args) -> None:
+        self.schedule_preview_update()
+
+    def _on_custom_field_name_write(self, *_args) -> None:
+        if self._suspend_traces:
+            return
+        self._sync_participant_columns_with_config()
+
+    def _on_split_setting_write(self, *_args) -> None:
+        # Runs even while traces are suspended: bulk loads must not leave
+        # the cached scalars stale.
+        self._refresh_split_settings()
+
+    def _refresh_split_settings(self) -> None:
+        raw_threshold = self.vars["split_name_threshold"].get().strip()
+        if raw_threshold:
+            self._split_threshold = self._safe_int(raw_threshold)
+            if self._split_threshold is None:
+                logging.warning(
+                    "Invalid split_name_threshold value '%s'; preview will not split recipient name.",
+                    raw_threshold,
+                )
+        else:
+            self._split_threshold = 24
+
+        raw_gap = self.vars["split_name_line_gap"].get().strip()
+        gap = self._safe_float(raw_gap) if raw_gap else None
+        if raw_gap and gap is None:
+            logging.warning(
+                "Invalid split_name_line_gap value '%s'; using fallback spacing for preview.",
+                raw_gap,
             )
+        self._split_gap_mm = gap
 
-    def _build_simple_entry(self, parent: ttk.Frame, row: int, label: str, key: str) -> None:
+    def _build_simple_entry(self, parent: ttk.Frame, row: int, label: str, key: str, kind: str = "text") -> None:
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", pady=5)
-        entry = ttk.Entry(parent, textvariable=self.vars[key])
+        options = {}
+        if kind == "int":
+            options = {"validate": "key", "validatecommand": self._int_vcmd}
+        elif kind == "float":
+            options = {"validate": "key", "validatecommand": self._float_vcmd}
+        entry = ttk.Entry(parent, textvariable=self.vars[key], **options)
         entry.grid(row=row, column=1, columnspan=2, sticky="ew", pady=5)
 
+    def _validate_int_entry(self, proposed: str) -> bool:
+        if proposed in ("", "-", "+"):
+            return True
+        digits = proposed[1:] if proposed[0] in "+-" else proposed
+        return digits.isdigit()
+
+    def _validate_float_entry(self, proposed: str) -> bool:
+        if proposed in ("", "-", "+", ".", "-.", "+."):
+            return True
+        try:
+            float(proposed)
+        except ValueError:
+            return False
+        return True
+
     def _build_color_entry(self, parent: ttk.Frame, row: int, label: str, key: str) -> None:
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", pady=5)
         color_frame = ttk.Frame(parent)
@@ -811,11 +1022,8 @@ class ConfigGUI:
 
     # ------------------------------------------------------------------ Config IO
     def _load_initial_configs(self) -> None:
+        # The other configs load lazily alongside their tabs in _on_tab_changed.
         self._load_initial_content_config()
-        self.load_participants()
-        self.load_email_config()
-        self.load_smtp_config()
-        self.load_debug_config()
 
     def _load_initial_content_config(self) -> None:
         if DEFAULT_CONFIG_PATH.exists():
@@ -834,8 +1042,7 @@ class ConfigGUI:
 
     def load_config(self, path: Path) -> None:
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = self._read_json_cached(path)
         except (OSError, json.JSONDecodeError) as exc:
             messagebox.showerror("Load Failed", f"Could not load config:\n{exc}")
             logging.exception("Failed to load config from %s", path)
@@ -844,13 +1051,19 @@ class ConfigGUI:
         self.current_config_path = path
         self.path_var.set(str(path))
 
-        for key, var in self.vars.items():
-            if key in data:
-                var.set(str(data[key]))
-            elif key in DEFAULT_VALUES:
-                var.set(DEFAULT_VALUES[key])
-            else:
-                var.set("")
+        # Suspend traces so the bulk var.set() loop schedules one preview
+        # render instead of one per field.
+        self._suspend_traces = True
+        try:
+            for key, var in self.vars.items():
+                if key in data:
+                    var.set(str(data[key]))
+                elif key in DEFAULT_VALUES:
+                    var.set(DEFAULT_VALUES[key])
+                else:
+                    var.set("")
+        finally:
+            self._suspend_traces = False
 
         self.visible_custom_fields = self._resolve_visible_custom_fields_from_config()
         self._render_content_tab()
@@ -858,92 +1071,76 @@ class ConfigGUI:
         self._sync_participant_columns_with_config()
         self.schedule_preview_update()
 
+    # Validation tables for collect_config: keys parsed as integers, keys
+    # parsed as numbers (stored as int when whole-valued), and the error
+    # message shown when parsing fails.
+    _INT_CONFIG_KEYS = frozenset(
+        {"font_size", "long_name_threshold", "long_name_font_size", "split_name_threshold"}
+    )
+    _NUMERIC_CONFIG_KEYS = frozenset(
+        {"text_y", "long_name_text_y", "split_name_line_gap", "split_name_font_size", "split_name_text_y"}
+    )
+    _CONFIG_ERROR_MESSAGES = {
+        "font_size": "Font size must be an integer.",
+        "text_y": "Text baseline (text_y) must be numeric.",
+        "long_name_threshold": "Long name threshold must be an integer.",
+        "long_name_font_size": "Long name font size must be an integer.",
+        "long_name_text_y": "Long name baseline must be numeric.",
+        "split_name_threshold": "Split name threshold must be an integer.",
+        "split_name_line_gap": "Split line gap must be numeric.",
+        "split_name_font_size": "Split name font size must be numeric.",
+        "split_name_text_y": "Split name baseline must be numeric.",
+    }
+
+    @classmethod
+    def _is_numeric_config_key(cls, key: str) -> bool:
+        if key in cls._NUMERIC_CONFIG_KEYS:
+            return True
+        return key.startswith("custom_field_") and key.endswith(("_font_size", "_text_x", "_text_y"))
+
     def collect_config(self) -> Optional[Dict[str, Union[float, int, str]]]:
         config: Dict[str, Union[float, int, str]] = {}
+        errors: List[str] = []
+        safe_int = self._safe_int
+        safe_float = self._safe_float
 
         for key, var in self.vars.items():
             value = var.get().strip()
             if not value:
                 if key == "orientation":
-                    messagebox.showerror("Invalid Value", "Orientation cannot be empty.")
-                    return None
+                    errors.append("Orientation cannot be empty.")
+                continue
+
+            cache_key = (key, value)
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                config[key] = cached
                 continue
 
-            if key == "font_size":
-                number = self._safe_int(value)
+            if key in self._INT_CONFIG_KEYS:
+                number = safe_int(value)
                 if number is None:
-                    messagebox.showerror("Invalid Value", "Font size must be an integer.")
-                    return None
+                    errors.append(self._CONFIG_ERROR_MESSAGES[key])
+                    continue
                 config[key] = number
-            elif key == "text_y":
-                position = self._safe_float(value)
-                if position is None:
-                    messagebox.showerror("Invalid Value", "Text baseline (text_y) must be numeric.")
-                    return None
-                config[key] = int(position) if position.is_integer() else position
-            elif key == "long_name_threshold":
-                threshold = self._safe_int(value)
-                if threshold is None:
-                    messagebox.showerror("Invalid Value", "Long name threshold must be an integer.")
-                    return None
-                config[key] = threshold
-            elif key == "long_name_font_size":
-                long_font = self._safe_int(value)
-                if long_font is None:
-                    messagebox.showerror("Invalid Value", "Long name font size must be an integer.")
-                    return None
-                config[key] = long_font
-            elif key == "long_name_text_y":
-                long_baseline = self._safe_float(value)
-                if long_baseline is None:
-                    messagebox.showerror("Invalid Value", "Long name baseline must be numeric.")
-                    return None
-                config[key] = int(long_baseline) if long_baseline.is_integer() else long_baseline
-            elif key == "split_name_threshold":
-                split_threshold = self._safe_int(value)
-                if split_threshold is None:
-                    messagebox.showerror("Invalid Value", "Split name threshold must be an integer.")
-                    return None
-                config[key] = split_threshold
-            elif key == "split_name_line_gap":
-                gap_value = self._safe_float(value)
-                if gap_value is None:
-                    messagebox.showerror("Invalid Value", "Split line gap must be numeric.")
-                    return None
-                config[key] = int(gap_value) if gap_value.is_integer() else gap_value
-            elif key == "split_name_font_size":
-                split_font = self._safe_float(value)
-                if split_font is None:
-                    messagebox.showerror("Invalid Value", "Split name font size must be numeric.")
-                    return None
-                config[key] = int(split_font) if split_font.is_integer() else split_font
-            elif key == "split_name_text_y":
-                split_baseline = self._safe_float(value)
-                if split_baseline is None:
-                    messagebox.showerror("Invalid Value", "Split name baseline must be numeric.")
-                    return None
-                config[key] = int(split_baseline) if split_baseline.is_integer() else split_baseline
-            elif key.startswith("custom_field_") and key.endswith("_name"):
-                config[key] = value
-            elif key.startswith("custom_field_") and key.endswith("_font_size"):
-                custom_font_size = self._safe_float(value)
-                if custom_font_size is None:
-                    messagebox.showerror("Invalid Value", f"{key} must be numeric.")
-                    return None
-                config[key] = int(custom_font_size) if custom_font_size.is_integer() else custom_font_size
-            elif key.startswith("custom_field_") and (key.endswith("_text_x") or key.endswith("_text_y")):
-                custom_position = self._safe_float(value)
-                if custom_position is None:
-                    messagebox.showerror("Invalid Value", f"{key} must be numeric.")
-                    return None
-                config[key] = int(custom_position) if custom_position.is_integer() else custom_position
-            elif key.startswith("custom_field_") and key.endswith("_text_color"):
-                config[key] = value
+                self._cache_store(self._parse_cache, cache_key, number, max_entries=256)
+            elif self._is_numeric_config_key(key):
+                number = safe_float(value)
+                if number is None:
+                    errors.append(self._CONFIG_ERROR_MESSAGES.get(key, f"{key} must be numeric."))
+                    continue
+                config[key] = int(number) if number.is_integer() else number
+                self._cache_store(self._parse_cache, cache_key, config[key], max_entries=256)
             elif key == "orientation":
-                config[key] = value.upper() if value.upper() in {"L", "P"} else "L"
+                orientation = value.upper()
+                config[key] = orientation if orientation in {"L", "P"} else "L"
             else:
                 config[key] = value
 
+        if errors:
+            messagebox.showerror("Invalid Values", "\n".join(errors))
+            return None
+
         return config
 
     def save_config(self) -> None:
@@ -955,13 +1152,13 @@ class ConfigGUI:
         if config is None:
             return
 
-        try:
-            with self.current_config_path.open("w", encoding="utf-8") as fh:
-                json.dump(config, fh, indent=2)
-            self.status_var.set(f"Saved configuration to {self.current_config_path}")
-        except OSError as exc:
-            messagebox.showerror("Save Failed", f"Could not save config:\n{exc}")
-            logging.exception("Failed to save config to %s", self.current_config_path)
+        self._write_json_config(
+            self.current_config_path,
+            config,
+            label="config",
+            status_var=self.status_var,
+            success_message=f"Saved configuration to {self.current_config_path}",
+        )
 
     def save_config_as(self) -> None:
         selected = filedialog.asksaveasfilename(
@@ -992,21 +1189,20 @@ class ConfigGUI:
         count = 0
 
         try:
-            with target_path.open("r", encoding="utf-8-sig", newline="") as fh:
-                reader = csv.DictReader(fh)
-                columns = reader.fieldnames
+            # 1 MiB buffer keeps large rosters bandwidth-bound instead of
+            # paying a read() syscall every default-sized 8 KiB block.
+            with target_path.open("r", encoding="utf-8-sig", newline="", buffering=1 << 20) as fh:
+                reader = csv.reader(fh)
+                columns = next(reader, None)
                 if not columns:
                     raise ValueError("CSV file does not contain a header row.")
 
                 normalized_columns = self._normalize_participant_columns(columns)
                 self._set_participants_columns(normalized_columns)
+                row_values = self._build_participant_row_mapper(columns)
                 if self.participants_tree is not None:
                     self.participants_tree.delete(*self.participants_tree.get_children())
-                    for row in reader:
-                        row = self._migrate_legacy_additional_row(dict(row))
-                        values = [(row.get(col, "") or "").strip() for col in self.participants_columns]
-                        self.participants_tree.insert("", "end", values=values)
-                        count += 1
+                    count = self._bulk_insert_participants(row_values(fields) for fields in reader)
         except FileNotFoundError:
             message = (
                 f"Participants file not found at {target_path}. "
@@ -1026,9 +1222,10 @@ class ConfigGUI:
         self.participants_path = target_path
         self.participants_path_var.set(str(self.participants_path))
         summary = f"Loaded {count} participant{'s' if count != 1 else ''} from {target_path}"
-        self.participants_status_var.set(summary)
         if show_message:
-            messagebox.showinfo("Participants Loaded", summary)
+            self._flash_status(self.participants_status_var, summary)
+        else:
+            self.participants_status_var.set(summary)
 
     def save_participants(self) -> None:
         if not self.participants_columns:
@@ -1038,19 +1235,22 @@ class ConfigGUI:
         if self.participants_tree is None:
             return
 
+        column_count = len(self.participants_columns)
+        item_values = self.participants_tree.item
+        all_values = [
+            item_values(item, "values") for item in self.participants_tree.get_children()
+        ]
         rows = []
-        for item in self.participants_tree.get_children():
-            values = self.participants_tree.item(item, "values")
-            row = {}
-            for idx, column in enumerate(self.participants_columns):
-                value = values[idx] if idx < len(values) else ""
-                row[column] = str(value).strip()
+        for values in all_values:
+            row = [str(value).strip() for value in values[:column_count]]
+            if len(row) < column_count:
+                row.extend([""] * (column_count - len(row)))
             rows.append(row)
 
         try:
-            with self.participants_path.open("w", encoding="utf-8", newline="") as fh:
-                writer = csv.DictWriter(fh, fieldnames=self.participants_columns)
-                writer.writeheader()
+            with self.participants_path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+                writer = csv.writer(fh)
+                writer.writerow(self.participants_columns)
                 writer.writerows(rows)
         except OSError as exc:
             messagebox.showerror("Save Failed", f"Could not save participants:\n{exc}")
@@ -1094,17 +1294,55 @@ class ConfigGUI:
         for var in self.participant_entry_vars.values():
             var.set("")
 
+        if self.participants_autosave_var.get():
+            if self._append_participant_row(values):
+                self.participants_status_var.set(
+                    f"Participant added and appended to {self.participants_path}."
+                )
+            return
+
         self.participants_status_var.set(
             "Participant added to the table. Remember to save the CSV to persist the change."
         )
 
+    def _append_participant_row(self, row_values: List[str]) -> bool:
+        """
+        Append a single row to the participants CSV without rewriting the
+        whole table, writing the header first if the file is new or empty.
+        Falls back to a full rewrite when the on-disk header differs from the
+        current columns — normalization reorders and injects columns, and
+        appending under a stale header would silently misalign the row.
+        """
+        try:
+            fspath = os.fspath(self.participants_path)
+            try:
+                write_header = os.stat(fspath).st_size == 0
+            except FileNotFoundError:
+                write_header = True
+            if not write_header:
+                with open(fspath, "r", encoding="utf-8", newline="") as fh:
+                    existing_header = next(csv.reader(fh), None)
+                if existing_header != list(self.participants_columns):
+                    self.save_participants()
+                    return True
+            with open(fspath, "a", encoding="utf-8", newline="", buffering=1 << 16) as fh:
+                writer = csv.writer(fh)
+                if write_header:
+                    writer.writerow(self.participants_columns)
+                writer.writerow(row_values)
+            return True
+        except OSError as exc:
+            messagebox.showerror("Save Failed", f"Could not append participant:\n{exc}")
+            logging.exception("Failed to append participant to %s", self.participants_path)
+            return False
+
     def remove_selected_participant(self) -> None:
         if self.participants_tree is None:
             return
 
         selection = self.participants_tree.selection()
         if not selection:
-            messagebox.showinfo("No Selection", "Select a participant row to remove.")
+            self._flash_status(self.participants_status_var, "Select a participant row to remove.")
             return
 
         for item in selection:
@@ -1115,35 +1353,109 @@ class ConfigGUI:
             f"Removed {count} participant{'s' if count != 1 else ''}. Save the CSV to confirm the change."
         )
 
-    def load_email_config(self, *, show_message: bool = False) -> None:
-        path = EMAIL_CONFIG_PATH
+    def _read_json_cached(self, path: Path) -> Dict:
+        """
+        Parse a config file, reusing the cached result while the file's
+        (mtime, size) stat signature is unchanged. Re-opening a tab or
+        reloading from file then skips the disk read and JSON parse.
+        """
+        fspath = os.fspath(path)
+        st = os.stat(fspath)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        entry = self._json_cache.get(fspath)
+        if entry is not None and entry[0] == stat_key:
+            return entry[1]
+        data = _read_json(fspath)
+        self._json_cache[fspath] = (stat_key, data)
+        return data
+
+    def _load_json_config(
+        self,
+        path: Path,
+        *,
+        label: str,
+        title: str,
+        status_var: tk.StringVar,
+        show_message: bool,
+        on_missing: Callable[[], str],
+        apply: Callable[[Dict], str],
+    ) -> None:
+        """
+        Shared load path for the email/SMTP/debug config files: one read,
+        one exception-handling block, and per-config behaviour injected via
+        on_missing (apply defaults, return the warning text) and apply
+        (populate widgets, return the success status text).
+        """
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = self._read_json_cached(path)
         except FileNotFoundError:
-            self.email_vars["subject"].set("")
-            self.email_vars["throttle_per_minute"].set("")
-            if self.email_body_widget:
-                self.email_body_widget.delete("1.0", tk.END)
-            message = f"Email config not found at {path}. Using empty defaults."
-            self.email_status_var.set(message)
+            message = on_missing()
+            status_var.set(message)
             if show_message:
-                messagebox.showwarning("Email Config Missing", message)
+                messagebox.showwarning(f"{title} Missing", message)
             return
         except (OSError, json.JSONDecodeError) as exc:
-            self.email_status_var.set(f"Could not load email config: {exc}")
-            logging.exception("Failed to load email config from %s", path)
+            status_var.set(f"Could not load {label}: {exc}")
+            logging.exception("Failed to load %s from %s", label, path)
             if show_message:
-                messagebox.showerror("Load Failed", f"Could not load email config:\n{exc}")
+                messagebox.showerror("Load Failed", f"Could not load {label}:\n{exc}")
             return
 
-        self.email_vars["subject"].set(str(data.get("subject", "")))
-        throttle_value = data.get("throttle_per_minute", "")
-        self.email_vars["throttle_per_minute"].set(str(throttle_value))
-        if self.email_body_widget:
-            self.email_body_widget.delete("1.0", tk.END)
-            self.email_body_widget.insert("1.0", data.get("body", ""))
-        self.email_status_var.set(f"Loaded email settings from {path}")
+        status_var.set(apply(data))
+
+    def _write_json_config(
+        self,
+        path: Path,
+        data: Dict,
+        *,
+        label: str,
+        status_var: tk.StringVar,
+        success_message: str,
+    ) -> None:
+        try:
+            # Serialize to one blob first: json.dump streams many tiny
+            # write() calls per token, dumps+write is a single one. Writing
+            # to a sibling temp file and renaming makes the save atomic, so
+            # a crash mid-write can never leave a torn config behind.
+            payload = _json_dumps(data)
+            fspath = os.fspath(path)
+            tmp_path = fspath + ".tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp_path, fspath)
+            self._json_cache.pop(fspath, None)
+            status_var.set(success_message)
+        except OSError as exc:
+            messagebox.showerror("Save Failed", f"Could not save {label}:\n{exc}")
+            logging.exception("Failed to save %s to %s", label, path)
+
+    def load_email_config(self, *, show_message: bool = False) -> None:
+        path = EMAIL_CONFIG_PATH
+
+        def on_missing() -> str:
+            self.email_vars["subject"].set("")
+            self.email_vars["throttle_per_minute"].set("")
+            if self.email_body_widget:
+                self.email_body_widget.delete("1.0", tk.END)
+            return f"Email config not found at {path}. Using empty defaults."
+
+        def apply(data: Dict) -> str:
+            self.email_vars["subject"].set(str(data.get("subject", "")))
+            self.email_vars["throttle_per_minute"].set(str(data.get("throttle_per_minute", "")))
+            if self.email_body_widget:
+                self.email_body_widget.delete("1.0", tk.END)
+                self.email_body_widget.insert("1.0", data.get("body", ""))
+            return f"Loaded email settings from {path}"
+
+        self._load_json_config(
+            path,
+            label="email config",
+            title="Email Config",
+            status_var=self.email_status_var,
+            show_message=show_message,
+            on_missing=on_missing,
+            apply=apply,
+        )
 
     def save_email_config(self) -> None:
         throttle_raw = self.email_vars["throttle_per_minute"].get().strip()
@@ -1165,41 +1477,36 @@ class ConfigGUI:
             "throttle_per_minute": throttle_value,
         }
 
-        try:
-            with EMAIL_CONFIG_PATH.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2, ensure_ascii=False)
-            self.email_status_var.set(f"Saved email settings to {EMAIL_CONFIG_PATH}")
-        except OSError as exc:
-            messagebox.showerror("Save Failed", f"Could not save email config:\n{exc}")
-            logging.exception("Failed to save email config to %s", EMAIL_CONFIG_PATH)
+        self._write_json_config(
+            EMAIL_CONFIG_PATH,
+            data,
+            label="email config",
+            status_var=self.email_status_var,
+            success_message=f"Saved email settings to {EMAIL_CONFIG_PATH}",
+        )
 
     def load_smtp_config(self, *, show_message: bool = False) -> None:
         path = SMTP_CONFIG_PATH
-        try:
-            with path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except FileNotFoundError:
+
+        def on_missing() -> str:
             for var in self.smtp_vars.values():
                 var.set("")
-            message = (
-                f"SMTP config not found at {path}. Enter the server details provided by your email provider."
-            )
-            self.smtp_status_var.set(message)
-            if show_message:
-                messagebox.showwarning("SMTP Config Missing", message)
-            return
-        except (OSError, json.JSONDecodeError) as exc:
-            self.smtp_status_var.set(f"Could not load SMTP config: {exc}")
-            logging.exception("Failed to load SMTP config from %s", path)
-            if show_message:
-                messagebox.showerror("Load Failed", f"Could not load SMTP config:\n{exc}")
-            return
-
-        self.smtp_vars["smtp_server"].set(str(data.get("smtp_server", "")))
-        self.smtp_vars["smtp_port"].set(str(data.get("smtp_port", "")))
-        self.smtp_vars["email_sender"].set(str(data.get("email_sender", "")))
-        self.smtp_vars["email_password"].set(str(data.get("email_password", "")))
-        self.smtp_status_var.set(f"Loaded SMTP settings from {path}")
+            return f"SMTP config not found at {path}. Enter the server details provided by your email provider."
+
+        def apply(data: Dict) -> str:
+            for key, var in self.smtp_vars.items():
+                var.set(str(data.get(key, "")))
+            return f"Loaded SMTP settings from {path}"
+
+        self._load_json_config(
+            path,
+            label="SMTP config",
+            title="SMTP Config",
+            status_var=self.smtp_status_var,
+            show_message=show_message,
+            on_missing=on_missing,
+            apply=apply,
+        )
 
     def save_smtp_config(self) -> None:
         server = self.smtp_vars["smtp_server"].get().strip()
@@ -1227,85 +1534,149 @@ class ConfigGUI:
             "email_password": password,
         }
 
-        try:
-            with SMTP_CONFIG_PATH.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
-            self.smtp_status_var.set(f"Saved SMTP settings to {SMTP_CONFIG_PATH}")
-        except OSError as exc:
-            messagebox.showerror("Save Failed", f"Could not save SMTP config:\n{exc}")
-            logging.exception("Failed to save SMTP config to %s", SMTP_CONFIG_PATH)
+        self._write_json_config(
+            SMTP_CONFIG_PATH,
+            data,
+            label="SMTP config",
+            status_var=self.smtp_status_var,
+            success_message=f"Saved SMTP settings to {SMTP_CONFIG_PATH}",
+        )
 
     def load_debug_config(self, *, show_message: bool = False) -> None:
         path = DEBUG_CONFIG_PATH
-        try:
-            with path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except FileNotFoundError:
+
+        def on_missing() -> str:
             self.debug_var.set(True)
-            message = f"Debug config not found at {path}. Defaulting to Test mode."
-            self.debug_status_var.set(message)
-            if show_message:
-                messagebox.showwarning("Debug Config Missing", message)
-            return
-        except (OSError, json.JSONDecodeError) as exc:
-            self.debug_status_var.set(f"Could not load debug config: {exc}")
-            logging.exception("Failed to load debug config from %s", path)
-            if show_message:
-                messagebox.showerror("Load Failed", f"Could not load debug config:\n{exc}")
-            return
+            return f"Debug config not found at {path}. Defaulting to Test mode."
 
-        raw_value = data.get("debug_mode", "Test")
-        normalized = str(raw_value).strip().lower()
+        def apply(data: Dict) -> str:
+            raw_value = data.get("debug_mode", "Test")
+            normalized = str(raw_value).strip().lower()
+
+            if normalized in {"test", "t", "false"}:
+                self.debug_var.set(True)
+                return f"Loaded debug mode (Test) from {path}"
+            if normalized in {"full", "f", "true"}:
+                self.debug_var.set(False)
+                return f"Loaded debug mode (Full) from {path}"
 
-        if normalized in {"test", "t", "false"}:
-            self.debug_var.set(True)
-            label = "Test"
-        elif normalized in {"full", "f", "true"}:
-            self.debug_var.set(False)
-            label = "Full"
-        else:
             message = (
                 f"Unsupported debug_mode value '{raw_value}'. "
                 "Expected 'Test'/'T' for test mode or 'Full'/'F' for production."
             )
             self.debug_var.set(True)
-            self.debug_status_var.set(message)
             logging.warning(message)
             if show_message:
                 messagebox.showwarning("Invalid Value", message)
-            return
-
-        self.debug_status_var.set(f"Loaded debug mode ({label}) from {path}")
+            return message
+
+        self._load_json_config(
+            path,
+            label="debug config",
+            title="Debug Config",
+            status_var=self.debug_status_var,
+            show_message=show_message,
+            on_missing=on_missing,
+            apply=apply,
+        )
 
     def save_debug_config(self) -> None:
         mode_value = "Test" if self.debug_var.get() else "Full"
-        data = {"debug_mode": mode_value}
 
-        try:
-            with DEBUG_CONFIG_PATH.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
-            self.debug_status_var.set(f"Saved debug mode ({mode_value}) to {DEBUG_CONFIG_PATH}")
-        except OSError as exc:
-            messagebox.showerror("Save Failed", f"Could not save debug config:\n{exc}")
-            logging.exception("Failed to save debug config to %s", DEBUG_CONFIG_PATH)
+        self._write_json_config(
+            DEBUG_CONFIG_PATH,
+            {"debug_mode": mode_value},
+            label="debug config",
+            status_var=self.debug_status_var,
+            success_message=f"Saved debug mode ({mode_value}) to {DEBUG_CONFIG_PATH}",
+        )
 
     # ------------------------------------------------------------------ Preview
     def schedule_preview_update(self, *_args) -> None:
-        if self.preview_after_id:
-            self.root.after_cancel(self.preview_after_id)
-        self.preview_after_id = self.root.after(250, self.update_preview)
+        if self._suspend_traces:
+            return
+        if not self._preview_visible():
+            # No point rendering while the preview pane is hidden; remember
+            # that inputs changed so the next tab switch catches up.
+            self._preview_dirty = True
+            return
+        # Writes to several variables in one Tk event (e.g. loading a config)
+        # collapse into a single after_idle callback before the throttle runs.
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        self.root.after_idle(self._throttled_preview_update)
+
+    def _throttled_preview_update(self) -> None:
+        self._preview_pending = False
+        # Leading-edge throttle: the first change after a quiet period
+        # renders immediately, later ones collapse into a single trailing
+        # call instead of a cancel/reschedule per keystroke.
+        now = time.monotonic()
+        elapsed = now - self._last_render_ts
+        if elapsed >= PREVIEW_THROTTLE_S:
+            if self.preview_after_id:
+                self.root.after_cancel(self.preview_after_id)
+                self.preview_after_id = None
+            self.update_preview()
+        elif self.preview_after_id is None:
+            delay_ms = max(int((PREVIEW_THROTTLE_S - elapsed) * 1000), 1)
+            self.preview_after_id = self.root.after(delay_ms, self.update_preview)
+
+    def _preview_visible(self) -> bool:
+        if not hasattr(self, "preview_frame"):
+            return True
+        return self.preview_frame.winfo_manager() == "pack"
 
     def update_preview(self) -> None:
         self.preview_after_id = None
-        background_path = Path(self.vars["background_image"].get())
-        image = self._load_background_image(background_path)
+        self._last_render_ts = time.monotonic()
 
-        draw = ImageDraw.Draw(image)
+        if not self._preview_visible():
+            # A render can still reach here directly (e.g. an after() callback
+            # that fired mid tab switch); defer it like the scheduler does.
+            self._preview_dirty = True
+            return
+
+        signature = self._preview_signature()
+        if (
+            signature == self._last_preview_signature
+            and self.preview_photo is not None
+            and self._preview_bg_photo is not None
+        ):
+            # Nothing changed since the last render; re-push the cached photo
+            # (e.g. after a tab switch) without redoing any PIL work. If the
+            # canvas items are already in place there is nothing to do at all.
+            if self._preview_text_item is None:
+                self._push_preview_to_canvas()
+            return
+
+        # Snapshot every Tk variable on the main thread, then hand the pure
+        # PIL work (image decode, font load, text rasterization) to the worker.
+        spec = self._collect_preview_spec()
+        self._preview_render_seq += 1
+        seq = self._preview_render_seq
+        future = self._preview_executor.submit(self._render_preview_image, spec)
+        future.add_done_callback(
+            lambda fut: self._post_to_main_thread(self._apply_preview, seq, signature, fut)
+        )
+
+    def _on_close(self) -> None:
+        # Drop any queued render and stop the worker so a late preview job
+        # cannot keep the process alive after the window is gone.
+        self._preview_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _post_to_main_thread(self, callback, *args) -> None:
+        try:
+            self.root.after(0, callback, *args)
+        except tk.TclError:
+            # Interpreter already shut down; drop the late render.
+            pass
+
+    def _collect_preview_spec(self) -> Dict:
+        """Gather all render inputs from Tk variables; must run on the main thread."""
         preview_text = self.preview_name_var.get().strip() or "Sample Recipient"
-        preview_custom_values = {
-            index: self.preview_custom_field_vars[index].get().strip()
-            for index in range(1, MAX_CUSTOM_FIELDS + 1)
-        }
 
         first_line = second_line = ""
         initial_split = self._should_split_preview_name(preview_text)
@@ -1315,49 +1686,183 @@ class ConfigGUI:
 
         page_width_mm, page_height_mm = self._page_dimensions_mm()
         font_size_pt, baseline_override = self._resolve_preview_style(preview_text, should_split)
-        font = self._load_preview_font(page_height_mm, image.height, font_size_pt)
-        color = self._parse_color(self.vars["text_color"].get())
 
-        baseline_mm = self._resolve_baseline_mm(font_size_pt, baseline_override)
-        baseline_px = self._mm_to_pixels(baseline_mm, page_height_mm, image.height)
+        custom_fields = []
+        for index in range(1, MAX_CUSTOM_FIELDS + 1):
+            field_name = self.vars[f"custom_field_{index}_name"].get().strip()
+            field_value = self.preview_custom_field_vars[index].get().strip()
+            if not field_name or not field_value:
+                continue
+
+            field_font_size = self._safe_float(self.vars[f"custom_field_{index}_font_size"].get())
+            field_text_x = self._safe_float(self.vars[f"custom_field_{index}_text_x"].get())
+            field_text_y = self._safe_float(self.vars[f"custom_field_{index}_text_y"].get())
+            if field_font_size is None or field_text_x is None or field_text_y is None:
+                continue
+
+            custom_fields.append(
+                {
+                    "value": field_value,
+                    "font_path": (
+                        self.vars[f"custom_field_{index}_font_path"].get().strip()
+                        or self.vars["font_path"].get().strip()
+                    ),
+                    "font_size": field_font_size,
+                    "text_x": field_text_x,
+                    "text_y": field_text_y,
+                    "color": self._parse_color(
+                        self.vars[f"custom_field_{index}_text_color"].get().strip()
+                        or self.vars["text_color"].get()
+                    ),
+                }
+            )
+
+        return {
+            "background_path": self.vars["background_image"].get(),
+            "font_path": self.vars["font_path"].get(),
+            "text": preview_text,
+            "first_line": first_line,
+            "second_line": second_line,
+            "should_split": should_split,
+            "split_gap_mm": self._resolve_split_gap_mm(font_size_pt) if should_split else 0.0,
+            "page_width_mm": page_width_mm,
+            "page_height_mm": page_height_mm,
+            "font_size_pt": font_size_pt,
+            "baseline_override": baseline_override,
+            "color": self._parse_color(self.vars["text_color"].get()),
+            "custom_fields": custom_fields,
+        }
+
+    def _render_preview_image(self, spec: Dict) -> Tuple[Image.Image, Tuple, Image.Image]:
+        """
+        Render the preview from a spec snapshot. Touches PIL only, never Tk.
+        Returns the (read-only) background thumbnail, its cache key, and a
+        transparent text overlay of the same size; the background stays a
+        static canvas layer so text-only edits re-upload just the overlay.
+        """
+        background, bg_key = self._get_background_thumbnail(Path(spec["background_path"]))
+        # Reuse one scratch overlay between frames instead of allocating a
+        # fresh RGBA buffer per render. Safe without locking: renders run on
+        # the single worker thread, and _apply_preview only reads the buffer
+        # while no newer render has been submitted.
+        image = self._overlay_scratch
+        if image is None or image.size != background.size:
+            image = Image.new("RGBA", background.size, (0, 0, 0, 0))
+            self._overlay_scratch = image
+        else:
+            image.paste((0, 0, 0, 0), (0, 0, *image.size))
+        draw = ImageDraw.Draw(image)
+
+        page_width_mm = spec["page_width_mm"]
+        page_height_mm = spec["page_height_mm"]
+        font_size_pt = spec["font_size_pt"]
+        color = spec["color"]
+        # One scale factor per axis instead of re-dividing in every
+        # mm-to-pixel conversion below.
+        px_per_mm_x = image.width / page_width_mm if page_width_mm > 0 else 1.0
+        px_per_mm_y = image.height / page_height_mm if page_height_mm > 0 else 1.0
+        font, ascent = self._load_preview_font_from_path(
+            spec["font_path"], page_height_mm, image.height, font_size_pt
+        )
+
+        baseline_mm = self._resolve_baseline_mm(font_size_pt, spec["baseline_override"])
+        baseline_px = baseline_mm * px_per_mm_y
 
         try:
-            if should_split:
-                gap_mm = self._resolve_split_gap_mm(font_size_pt)
-                gap_px = max(self._mm_to_pixels(gap_mm, page_height_mm, image.height), 0.0)
+            if spec["should_split"]:
+                gap_px = max(spec["split_gap_mm"] * px_per_mm_y, 0.0)
                 first_baseline_px = baseline_px - gap_px
-                first_top_px = self._baseline_to_top_px(font, first_baseline_px)
-                second_top_px = self._baseline_to_top_px(font, baseline_px)
-                if first_line:
-                    first_x = self._center_text_x(draw, image.width, first_line, font)
-                    draw.text((first_x, first_top_px), first_line, font=font, fill=color)
-                second_x = self._center_text_x(draw, image.width, second_line, font)
-                draw.text((second_x, second_top_px), second_line, font=font, fill=color)
+                first_top_px = self._baseline_to_top_px(ascent, first_baseline_px)
+                second_top_px = self._baseline_to_top_px(ascent, baseline_px)
+                if spec["first_line"]:
+                    first_x = self._center_text_x(draw, image.width, spec["first_line"], font)
+                    draw.text((first_x, first_top_px), spec["first_line"], font=font, fill=color)
+                second_x = self._center_text_x(draw, image.width, spec["second_line"], font)
+                draw.text((second_x, second_top_px), spec["second_line"], font=font, fill=color)
             else:
-                top_px = self._baseline_to_top_px(font, baseline_px)
-                text_x = self._center_text_x(draw, image.width, preview_text, font)
-                draw.text((text_x, top_px), preview_text, font=font, fill=color)
-
-            self._draw_preview_custom_fields(
-                draw=draw,
-                image_width=image.width,
-                image_height=image.height,
-                page_width_mm=page_width_mm,
-                page_height_mm=page_height_mm,
-                values=preview_custom_values,
-                color=color,
-            )
+                top_px = self._baseline_to_top_px(ascent, baseline_px)
+                text_x = self._center_text_x(draw, image.width, spec["text"], font)
+                draw.text((text_x, top_px), spec["text"], font=font, fill=color)
+
+            for field in spec["custom_fields"]:
+                field_font, field_ascent = self._load_preview_font_from_path(
+                    field["font_path"], page_height_mm, image.height, field["font_size"]
+                )
+                x_px = field["text_x"] * px_per_mm_x
+                field_baseline_px = field["text_y"] * px_per_mm_y
+                top_px = self._baseline_to_top_px(field_ascent, field_baseline_px)
+                draw.text((int(round(x_px)), top_px), field["value"], font=field_font, fill=field["color"])
         except OSError as exc:
             logging.exception("Failed to draw text onto preview: %s", exc)
 
-        display_image = self._downscale_for_canvas(image)
-        self.preview_photo = ImageTk.PhotoImage(display_image)
-        self.preview_canvas.delete("all")
-        self.preview_canvas.config(
-            width=self.preview_photo.width(),
-            height=self.preview_photo.height(),
+        return background, bg_key, image
+
+    def _apply_preview(self, seq: int, signature: Tuple, future) -> None:
+        if seq != self._preview_render_seq:
+            # A newer render was scheduled while this one was in flight.
+            return
+        try:
+            background, bg_key, overlay = future.result()
+        except Exception:
+            logging.exception("Preview render failed")
+            return
+
+        # ImageTk.PhotoImage must be created on the Tk main thread. The
+        # background photo is rebuilt only when the background itself changed.
+        if bg_key != self._preview_bg_key or self._preview_bg_photo is None:
+            bg_image = self._downscale_for_canvas(background)
+            if (
+                self._preview_bg_photo is not None
+                and (self._preview_bg_photo.width(), self._preview_bg_photo.height())
+                == bg_image.size
+            ):
+                self._preview_bg_photo.paste(bg_image)
+            else:
+                self._preview_bg_photo = ImageTk.PhotoImage(bg_image)
+            self._preview_bg_key = bg_key
+        if (
+            self.preview_photo is not None
+            and (self.preview_photo.width(), self.preview_photo.height()) == overlay.size
+        ):
+            # Same dimensions: blit the new pixels into the existing Tk photo
+            # instead of allocating a fresh one each frame.
+            self.preview_photo.paste(overlay)
+        else:
+            self.preview_photo = ImageTk.PhotoImage(overlay)
+        self._last_preview_signature = signature
+        self._push_preview_to_canvas()
+
+    def _preview_signature(self) -> Tuple:
+        """Hashable snapshot of every input that influences the rendered preview."""
+        try:
+            background_mtime = os.stat(self.vars["background_image"].get()).st_mtime_ns
+        except OSError:
+            background_mtime = None
+        return (
+            tuple(var.get() for var in self.vars.values()),
+            self.preview_name_var.get(),
+            tuple(var.get() for var in self.preview_custom_field_vars.values()),
+            background_mtime,
         )
-        self.preview_canvas.create_image(0, 0, anchor="nw", image=self.preview_photo)
+
+    def _push_preview_to_canvas(self) -> None:
+        canvas_size = (self._preview_bg_photo.width(), self._preview_bg_photo.height())
+        if canvas_size != self._last_canvas_size:
+            self.preview_canvas.config(width=canvas_size[0], height=canvas_size[1])
+            self._last_canvas_size = canvas_size
+        if self._preview_canvas_item is None:
+            self._preview_canvas_item = self.preview_canvas.create_image(
+                0, 0, anchor="nw", image=self._preview_bg_photo
+            )
+        else:
+            self.preview_canvas.itemconfigure(self._preview_canvas_item, image=self._preview_bg_photo)
+        if self._preview_text_item is None:
+            # Created after the background item so the overlay stacks on top.
+            self._preview_text_item = self.preview_canvas.create_image(
+                0, 0, anchor="nw", image=self.preview_photo
+            )
+        else:
+            self.preview_canvas.itemconfigure(self._preview_text_item, image=self.preview_photo)
 
     def _resolve_preview_style(self, full_name: str, split: bool) -> Tuple[float, Optional[float]]:
         base_font_size = self._safe_float(self.vars["font_size"].get()) or 32.0
@@ -1409,29 +1914,15 @@ class ConfigGUI:
         return font_size, baseline
 
     def _should_split_preview_name(self, full_name: str) -> bool:
-        raw_value = self.vars["split_name_threshold"].get().strip()
-        if raw_value:
-            threshold = self._safe_int(raw_value)
-            if threshold is None:
-                logging.warning(
-                    "Invalid split_name_threshold value '%s'; preview will not split recipient name.",
-                    raw_value,
-                )
-                return False
-        else:
-            threshold = 24
-        return self._count_name_characters(full_name) > threshold
+        # _split_threshold is None only when the entry holds an invalid value
+        # (already warned about on write); the preview then never splits.
+        if self._split_threshold is None:
+            return False
+        return self._count_name_characters(full_name) > self._split_threshold
 
     def _resolve_split_gap_mm(self, font_size_pt: float) -> float:
-        raw_value = self.vars["split_name_line_gap"].get().strip()
-        if raw_value:
-            gap = self._safe_float(raw_value)
-            if gap is not None:
-                return gap
-            logging.warning(
-                "Invalid split_name_line_gap value '%s'; using fallback spacing for preview.",
-                raw_value,
-            )
+        if self._split_gap_mm is not None:
+            return self._split_gap_mm
         return self._pt_to_mm(font_size_pt or 0.0) * 0.85
 
     @staticmethod
@@ -1449,6 +1940,7 @@ class ConfigGUI:
         color_code = colorchooser.askcolor(color=initial)
         if color_code and color_code[1]:
             self.vars["text_color"].set(color_code[1])
+            self.schedule_preview_update()
 
     def choose_color_for_key(self, key: str) -> None:
         initial = self.vars[key].get().strip() or self.vars["text_color"].get() or "#000000"
@@ -1457,6 +1949,20 @@ class ConfigGUI:
             self.vars[key].set(color_code[1])
 
     # ------------------------------------------------------------------ Helpers
+    def _flash_status(self, status_var: tk.StringVar, message: str, *, duration_ms: int = 3000) -> None:
+        """
+        Show a transient status message instead of a modal dialog. Modal info
+        boxes block the main loop in a nested event loop; a status flash keeps
+        the GUI responsive for routine confirmations.
+        """
+        status_var.set(message)
+
+        def clear() -> None:
+            if status_var.get() == message:
+                status_var.set("")
+
+        self.root.after(duration_ms, clear)
+
     def _select_path_for_key(self, key: str, title: str, filetypes: List[Tuple[str, str]]) -> None:
         initial = self.vars[key].get()
         initialdir = Path(initial).parent if initial else DEFAULT_CONFIG_PATH.parent
@@ -1464,23 +1970,56 @@ class ConfigGUI:
         if selected:
             self.vars[key].set(selected)
 
-    def _load_background_image(self, path: Path) -> Image.Image:
+    def _get_background_thumbnail(self, path: Path) -> Tuple[Image.Image, Tuple]:
+        """
+        Return the preview-resolution background and its cache key. The image
+        is shared with the cache and must be treated as read-only — text is
+        drawn onto a separate overlay, never onto the background itself.
+        """
         try:
-            image = Image.open(path).convert("RGBA")
+            fspath = os.fspath(path)
+            st = os.stat(fspath)
+            cache_key = (fspath, st.st_mtime_ns, st.st_size)
+            cached = self._background_cache.get(cache_key)
+            if cached is None:
+                cached = Image.open(path)
+                # Ask libjpeg for a reduced-scale decode up front (no-op for
+                # PNG); recent Pillow thumbnails draft on their own, but being
+                # explicit keeps the fast path on older versions. The 2x
+                # headroom leaves the final filter enough pixels to work with.
+                cached.draft("RGB", (PREVIEW_MAX_WIDTH * 2, PREVIEW_MAX_HEIGHT * 2))
+                # Cache at preview resolution: text is drawn in coordinates
+                # relative to the image size, so rendering on the thumbnail
+                # gives the same layout without full-resolution raster work.
+                # Downscale in the file's native mode first (letting JPEGs use
+                # draft-mode decoding) and only convert the small result.
+                # BILINEAR is plenty for an on-screen thumbnail and noticeably
+                # cheaper than LANCZOS on large sources.
+                cached.thumbnail((PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT), Image.BILINEAR)
+                cached = cached.convert("RGBA")
+                self._cache_store(self._background_cache, cache_key, cached)
+            return cached, cache_key
         except (FileNotFoundError, OSError):
-            logging.warning("Background image not found or invalid: %s", path)
-            image = Image.new("RGBA", (1600, 1131), "#dddddd")
-            fallback_draw = ImageDraw.Draw(image)
-            fallback_draw.text((20, 20), "Background preview unavailable", fill="#444444")
-        return image
-
-    def _load_preview_font(self, page_height_mm: float, image_height: int, font_size_pt: float) -> ImageFont.ImageFont:
-        return self._load_preview_font_from_path(
-            self.vars["font_path"].get(),
-            page_height_mm,
-            image_height,
-            font_size_pt,
-        )
+            path_str = str(path)
+            if path_str != self._warned_missing_background:
+                logging.warning("Background image not found or invalid: %s", path)
+                self._warned_missing_background = path_str
+            if self._background_placeholder is None:
+                # A4-landscape aspect, sized within the preview bounds so
+                # _downscale_for_canvas leaves it untouched and the text
+                # overlay (rendered at this size) stays aligned on top.
+                image = Image.new("RGBA", (849, 600), "#dddddd")
+                fallback_draw = ImageDraw.Draw(image)
+                fallback_draw.text((20, 20), "Background preview unavailable", fill="#444444")
+                self._background_placeholder = image
+            return self._background_placeholder, (str(path), None, None)
+
+    @staticmethod
+    def _cache_store(cache: Dict, key, value, *, max_entries: int = 8) -> None:
+        """Store a cache entry, evicting the oldest one beyond the size cap."""
+        while len(cache) >= max_entries:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
 
     def _load_preview_font_from_path(
         self,
@@ -1488,7 +2027,8 @@ class ConfigGUI:
         page_height_mm: float,
         image_height: int,
         font_size_pt: float,
-    ) -> ImageFont.ImageFont:
+    ) -> Tuple[ImageFont.ImageFont, int]:
+        """Return the cached font together with its ascent in pixels."""
         font_path = Path(font_path_value)
         font_size_pt = font_size_pt or 32.0
         font_size_mm = self._pt_to_mm(font_size_pt)
@@ -1497,46 +2037,31 @@ class ConfigGUI:
             1,
         )
         try:
-            return ImageFont.truetype(str(font_path), font_size_px)
+            st = os.stat(str(font_path))
+            file_signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_signature = None
+        cache_key = (str(font_path), file_signature, font_size_px)
+        cached = self._font_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            font = ImageFont.truetype(str(font_path), font_size_px)
         except (OSError, ValueError):
             logging.warning("Falling back to default font for preview. Invalid font path: %s", font_path)
-            return ImageFont.load_default()
-
-    def _draw_preview_custom_fields(
-        self,
-        *,
-        draw: ImageDraw.ImageDraw,
-        image_width: int,
-        image_height: int,
-        page_width_mm: float,
-        page_height_mm: float,
-        values: Dict[int, str],
-        color: str,
-    ) -> None:
-        for index in range(1, MAX_CUSTOM_FIELDS + 1):
-            field_name = self.vars[f"custom_field_{index}_name"].get().strip()
-            field_value = values.get(index, "").strip()
-            if not field_name or not field_value:
-                continue
-
-            font_size = self._safe_float(self.vars[f"custom_field_{index}_font_size"].get())
-            text_x = self._safe_float(self.vars[f"custom_field_{index}_text_x"].get())
-            text_y = self._safe_float(self.vars[f"custom_field_{index}_text_y"].get())
-            if font_size is None or text_x is None or text_y is None:
-                continue
+            font = ImageFont.load_default()
+            return font, self._font_ascent(font)
+        entry = (font, self._font_ascent(font))
+        self._cache_store(self._font_cache, cache_key, entry)
+        return entry
 
-            font_path = (
-                self.vars[f"custom_field_{index}_font_path"].get().strip()
-                or self.vars["font_path"].get().strip()
-            )
-            field_color = self._parse_color(
-                self.vars[f"custom_field_{index}_text_color"].get().strip() or self.vars["text_color"].get()
-            )
-            font = self._load_preview_font_from_path(font_path, page_height_mm, image_height, font_size)
-            x_px = self._mm_to_pixels(text_x, page_width_mm, image_width)
-            baseline_px = self._mm_to_pixels(text_y, page_height_mm, image_height)
-            top_px = self._baseline_to_top_px(font, baseline_px)
-            draw.text((int(round(x_px)), top_px), field_value, font=font, fill=field_color)
+    @staticmethod
+    def _font_ascent(font: ImageFont.ImageFont) -> int:
+        try:
+            ascent, _ = font.getmetrics()
+        except AttributeError:
+            ascent = getattr(font, "size", 0)
+        return ascent
 
     def _resolve_baseline_mm(self, font_size_pt: float, baseline_override: Optional[float]) -> float:
         if baseline_override is not None:
@@ -1545,11 +2070,12 @@ class ConfigGUI:
         font_size_pt = font_size_pt or 32.0
         return self._pt_to_mm(font_size_pt)
 
+    # A4 sizes per orientation; resolved with one dict lookup per render.
+    _PAGE_DIMENSIONS_MM = {"P": (210.0, 297.0), "L": (297.0, 210.0)}
+
     def _page_dimensions_mm(self) -> Tuple[float, float]:
         orientation = (self.vars["orientation"].get() or "L").upper()
-        if orientation == "P":
-            return 210.0, 297.0
-        return 297.0, 210.0
+        return self._PAGE_DIMENSIONS_MM.get(orientation, self._PAGE_DIMENSIONS_MM["L"])
 
     @staticmethod
     def _count_name_characters(value: str) -> int:
@@ -1562,36 +2088,49 @@ class ConfigGUI:
         return (value_mm / total_mm) * float(total_px)
 
     @staticmethod
-    def _baseline_to_top_px(font: ImageFont.ImageFont, baseline_px: float) -> int:
-        try:
-            ascent, _ = font.getmetrics()
-        except AttributeError:
-            ascent = getattr(font, "size", 0)
-        top_px = baseline_px - ascent
-        return int(round(top_px))
+    def _baseline_to_top_px(ascent: int, baseline_px: float) -> int:
+        return int(round(baseline_px - ascent))
 
     def _center_text_x(self, draw: ImageDraw.ImageDraw, width: int, text: str, font: ImageFont.ImageFont) -> int:
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-        except AttributeError:
-            text_width, _ = draw.textsize(text, font=font)
+        # Text measurement walks the whole FreeType layout path, so memoize
+        # it per (text, font). Keying on the font object itself keeps it
+        # alive for the lifetime of the entry, so ids cannot be recycled.
+        cache_key = (text, font)
+        text_width = self._text_width_cache.get(cache_key)
+        if text_width is None:
+            try:
+                bbox = draw.textbbox((0, 0), text, font=font)
+                text_width = bbox[2] - bbox[0]
+            except AttributeError:
+                text_width, _ = draw.textsize(text, font=font)
+            self._cache_store(self._text_width_cache, cache_key, text_width, max_entries=256)
         return max(int((width - text_width) / 2), 0)
 
     def _downscale_for_canvas(self, image: Image.Image) -> Image.Image:
         width, height = image.size
         scale = min(PREVIEW_MAX_WIDTH / width, PREVIEW_MAX_HEIGHT / height, 1.0)
-        if scale < 1.0:
-            new_size = (int(width * scale), int(height * scale))
-            return image.resize(new_size, Image.LANCZOS)
-        return image
-
-    @staticmethod
-    def _pt_to_mm(points: float) -> float:
-        return points * 25.4 / 72.0
+        if scale >= 1.0:
+            return image
+        new_size = (int(width * scale), int(height * scale))
+        if scale < 0.5:
+            # Deep downscale: integer box reduction first is O(N/k^2) and
+            # cheap, then one small BILINEAR pass lands the exact target.
+            image = image.reduce(int(1 / scale))
+            if image.size == new_size:
+                return image
+        return image.resize(new_size, Image.BILINEAR)
+
+    _PT_TO_MM = 25.4 / 72.0
+
+    @classmethod
+    def _pt_to_mm(cls, points: float) -> float:
+        return points * cls._PT_TO_MM
 
     @staticmethod
     def _safe_float(value: str) -> Optional[float]:
+        if not value:
+            # Empty entries are the common miss; skip the exception machinery.
+            return None
         try:
             return float(value)
         except (TypeError, ValueError):
@@ -1599,16 +2138,18 @@ class ConfigGUI:
 
     @staticmethod
     def _safe_int(value: str) -> Optional[int]:
+        if not value:
+            return None
+        digits = value[1:] if value[0] in "+-" else value
+        if digits.isdigit():
+            # Plain integer literal; avoid the try/except path entirely.
+            return int(value)
         try:
             return int(value)
         except (TypeError, ValueError):
             return None
 
-    @staticmethod
-    def _parse_color(value: str) -> str:
-        if isinstance(value, str) and len(value) in {4, 7} and value.startswith("#"):
-            return value
-        return "#000000"
+    _parse_color = staticmethod(_parse_color)
 
     def _normalize_participant_columns(self, columns: List[str]) -> List[str]:
         standard_columns = ["FirstName", "LastName", "Email"]
@@ -1639,23 +2180,38 @@ class ConfigGUI:
 
         return normalized
 
-    def _migrate_legacy_additional_row(self, row: Dict[str, str]) -> Dict[str, str]:
-        if "Additional" not in row:
-            return row
-
-        custom_field_names = self._get_defined_custom_field_names()
-        if not custom_field_names:
-            row.pop("Additional", None)
-            return row
-
-        first_custom_field = custom_field_names[0]
-        additional_value = (row.get("Additional", "") or "").strip()
-        current_value = (row.get(first_custom_field, "") or "").strip()
-        if additional_value and not current_value:
-            row[first_custom_field] = additional_value
-
-        row.pop("Additional", None)
-        return row
+    def _build_participant_row_mapper(self, source_columns: List[str]):
+        """
+        Return a callable mapping raw csv.reader fields onto the current display
+        columns. The column-index lookups (including the legacy `Additional`
+        migration target) are resolved once per file instead of per row, so the
+        loader avoids building a dict for every participant.
+        """
+        source_index = {name: idx for idx, name in enumerate(source_columns)}
+        column_indices = [source_index.get(column) for column in self.participants_columns]
+
+        additional_index = source_index.get("Additional")
+        migrate_position: Optional[int] = None
+        if additional_index is not None:
+            custom_field_names = self._get_defined_custom_field_names()
+            if custom_field_names and custom_field_names[0] in self.participants_columns:
+                migrate_position = self.participants_columns.index(custom_field_names[0])
+
+        def row_values(fields: List[str]) -> List[str]:
+            field_count = len(fields)
+            values = [
+                fields[idx].strip() if idx is not None and idx < field_count else ""
+                for idx in column_indices
+            ]
+            if (
+                migrate_position is not None
+                and not values[migrate_position]
+                and additional_index < len(fields)
+            ):
+                values[migrate_position] = fields[additional_index].strip()
+            return values
+
+        return row_values
 
 
 def main() -> None:
@@ -2,51 +2,85 @@ from email.mime.application import MIMEApplication
 
 import pandas as pd
 import smtplib
+import csv
+import gc
+import io
 import os
+import sys
 import json
 import logging
+import logging.handlers
 import time
 import traceback
+import types
+import zipfile
+
+from concurrent.futures import ProcessPoolExecutor
 
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
-from email import encoders
 from fpdf import FPDF
 
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow ships with fpdf2
+    Image = None
+
 MAX_CUSTOM_FIELDS = 5
 
-# Set up logging
+# Set up logging. The file is opened lazily on first write and records are
+# buffered in memory (flushed on ERROR, overflow, or shutdown) so the hot
+# per-row loop does not pay for a disk write per log call. The formatter
+# must sit on the target FileHandler: the MemoryHandler only stores records,
+# and the handler that ultimately emits them does the formatting.
+_log_file_handler = logging.FileHandler('logging.log', delay=True)  # Info log file
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('logging.log'),  # Info log file
+        logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=_log_file_handler,
+        ),
     ]
 )
 # Silence verbose fontTools logs emitted during font subsetting.
 logging.getLogger("fontTools").setLevel(logging.WARNING)
 
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parsed config files keyed by (path, mtime_ns, size); repeat loads — e.g.
+# from pool worker initializers — skip the disk read and JSON parse.
+_CONFIG_CACHE = {}
+
+
 # Function to load and merge multiple configuration files
 def load_config(config_files):
     config = {}
     for config_file in config_files:
-        with open(config_file, "r", encoding="utf-8") as file:
-            current_config = json.load(file)
-            # Merge the current config with the main config
-            config.update(current_config)
+        path = os.fspath(config_file)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        current_config = _CONFIG_CACHE.get(key)
+        if current_config is None:
+            with open(path, "rb") as file:
+                current_config = _json_loads(file.read())
+            _CONFIG_CACHE[key] = current_config
+        # Merge the current config with the main config
+        config.update(current_config)
     return config
 
 
-def resolve_debug_mode(debug_mode_config):
-    """
-    Normalize the debug mode setting so the caller can decide whether to send emails.
-    Accepts legacy values like 'T'/'F' alongside the new 'Test'/'Full' strings.
-    """
-    raw_value = debug_mode_config.get("debug_mode")
-    normalized = str(raw_value).strip().lower()
-
-    mapping = {
+# Accepted debug_mode spellings, built once and frozen so every call is a
+# single dict lookup instead of rebuilding the table.
+_DEBUG_MODE_TABLE = types.MappingProxyType(
+    {
         "full": ("Full", True),
         "f": ("Full", True),
         "true": ("Full", True),
@@ -54,17 +88,49 @@ def resolve_debug_mode(debug_mode_config):
         "t": ("Test", False),
         "false": ("Test", False),
     }
+)
+
+
+def resolve_debug_mode(debug_mode_config):
+    """
+    Normalize the debug mode setting so the caller can decide whether to send emails.
+    Accepts legacy values like 'T'/'F' alongside the new 'Test'/'Full' strings.
+    """
+    raw_value = debug_mode_config.get("debug_mode")
+    normalized = str(raw_value).strip().lower()
 
-    if normalized in mapping:
-        return mapping[normalized]
+    result = _DEBUG_MODE_TABLE.get(normalized)
+    if result is not None:
+        return result
 
     raise ValueError(
         f"Unsupported debug_mode value: {raw_value}. Expected 'Test' or 'Full'."
     )
 
+# Measured string widths keyed by (font family, size, text); repeated names
+# and common surnames across a batch then skip fpdf's per-character walk.
+_STRING_WIDTH_CACHE = {}
+_STRING_WIDTH_CACHE_MAX = 4096
+
+
+def _string_width(pdf, text):
+    font_family = getattr(pdf, "font_family", None)
+    if font_family is None:
+        # Fallback for PDF objects that do not expose their font state.
+        return pdf.get_string_width(text)
+    key = (font_family, getattr(pdf, "font_size_pt", None), text)
+    width = _STRING_WIDTH_CACHE.get(key)
+    if width is None:
+        width = pdf.get_string_width(text)
+        while len(_STRING_WIDTH_CACHE) >= _STRING_WIDTH_CACHE_MAX:
+            _STRING_WIDTH_CACHE.pop(next(iter(_STRING_WIDTH_CACHE)))
+        _STRING_WIDTH_CACHE[key] = width
+    return width
+
+
 def calculate_text_center(pdf, text, page_width):
     """Calculate the X position to center text."""
-    text_width = pdf.get_string_width(text)
+    text_width = _string_width(pdf, text)
     x_position = (page_width - text_width) / 2  # Center horizontally
     return x_position
 
@@ -99,9 +165,14 @@ def _safe_float(value):
         return None
 
 
+# Translation table that deletes ASCII whitespace; names only ever contain
+# plain spaces, and str.translate counts in C instead of a per-char loop.
+_WHITESPACE_DELETE_TABLE = dict.fromkeys(map(ord, " \t\n\r\v\f"))
+
+
 def _count_name_characters(full_name):
     """Length of the recipient name excluding whitespace."""
-    return sum(1 for char in full_name if not char.isspace())
+    return len(full_name.translate(_WHITESPACE_DELETE_TABLE))
 
 
 def should_split_full_name(full_name, config):
@@ -110,16 +181,9 @@ def should_split_full_name(full_name, config):
     Falls back to a default threshold of 24 characters (excluding whitespace)
     when the configuration omits the split limit.
     """
-    threshold_raw = config.get("split_name_threshold", 24)
-    threshold = _safe_int(threshold_raw)
+    threshold = _resolved_style(config)["split_threshold"]
     if threshold is None:
-        logging.warning(
-            "Invalid split_name_threshold value '%s'; expected integer. Skipping multi-line split for '%s'.",
-            threshold_raw,
-            full_name,
-        )
         return False
-
     return _count_name_characters(full_name) > threshold
 
 
@@ -128,8 +192,7 @@ def resolve_split_line_gap(pdf, config):
     Decide how far apart (in mm) to place multi-line names.
     Uses the configured value if present; otherwise derives spacing from the font height.
     """
-    gap_raw = config.get("split_name_line_gap")
-    gap = _safe_float(gap_raw)
+    gap = _resolved_style(config)["split_gap"]
     if gap is not None:
         return gap
     return pdf.font_size * 0.85
@@ -140,31 +203,15 @@ def resolve_split_style(base_font_size, baseline_override, config):
     Determine the font size and baseline override for split (multi-line) name rendering.
     Falls back to the already-resolved values when the configuration omits the overrides.
     """
-    font_size = base_font_size
-    raw_font_size = config.get("split_name_font_size")
-    if raw_font_size is not None:
-        override_font = _safe_float(raw_font_size)
-        if override_font is None:
-            logging.warning(
-                "Invalid split_name_font_size value '%s'; using resolved font size %s.",
-                raw_font_size,
-                base_font_size,
-            )
-        else:
-            font_size = override_font
+    style = _resolved_style(config)
 
-    baseline = baseline_override
-    raw_baseline = config.get("split_name_text_y")
-    if raw_baseline is not None:
-        override_baseline = _safe_float(raw_baseline)
-        if override_baseline is None:
-            logging.warning(
-                "Invalid split_name_text_y value '%s'; using resolved baseline %s.",
-                raw_baseline,
-                baseline_override,
-            )
-        else:
-            baseline = override_baseline
+    font_size = style["split_font_size"]
+    if font_size is None:
+        font_size = base_font_size
+
+    baseline = style["split_text_y"]
+    if baseline is None:
+        baseline = baseline_override
 
     return font_size, baseline
 
@@ -174,29 +221,25 @@ def resolve_name_style(full_name, config):
     Compute the font size and optional baseline override for the given name.
     Falls back to the default font settings when the long-name configuration is missing or invalid.
     """
-    base_font_size = _safe_float(config.get("font_size"))
+    style = _resolved_style(config)
+    base_font_size = style["base_font_size"]
     if base_font_size is None:
         raise ValueError("Invalid or missing font_size in content configuration.")
 
-    threshold_raw = config.get("long_name_threshold")
-    threshold = _safe_int(threshold_raw)
-    if threshold_raw is not None and threshold is None:
-        logging.warning("Invalid long_name_threshold value '%s'; expected integer.", threshold_raw)
-
+    threshold = style["long_threshold"]
     use_alternate = threshold is not None and _count_name_characters(full_name) > threshold
 
     if use_alternate:
-        alt_font_size = _safe_float(config.get("long_name_font_size"))
+        alt_font_size = style["long_font_size"]
         if alt_font_size is None:
             logging.warning(
                 "long_name_font_size is missing or invalid; defaulting to primary font_size for '%s'.",
                 full_name,
             )
             alt_font_size = base_font_size
-        text_y = config.get("long_name_text_y", config.get("text_y"))
-        return alt_font_size, text_y
+        return alt_font_size, style["long_text_y"]
 
-    return base_font_size, config.get("text_y")
+    return base_font_size, style["text_y"]
 
 
 def parse_hex_color(color_code):
@@ -310,48 +353,202 @@ def draw_custom_field_text(pdf, page_width, page_height, field_config, field_val
     pdf.text(text_x, text_y, field_value)
 
 
-def generate_certificate(name, surname, email, custom_field_values=None):
+# Asset paths validated once per process; every certificate shares the same
+# background and font files, so re-checking them per row is wasted stat calls.
+_VERIFIED_PATHS = set()
+
+# Background images decoded once per (path, stat signature) and handed to
+# fpdf2 as ready PIL images, skipping the per-certificate file read + decode.
+_BACKGROUND_CACHE = {}
+
+
+def _ensure_asset_exists(path, description, email):
+    if path in _VERIFIED_PATHS:
+        return
+    if not os.path.exists(path):
+        logging.error("%s not found at %s while creating certificate for %s", description, path, email)
+        raise FileNotFoundError(f"{description} not found: {path}")
+    _VERIFIED_PATHS.add(path)
+
+
+# Resolution at which backgrounds are embedded; higher source resolutions
+# only inflate every certificate without a visible gain on an A4 page.
+_BACKGROUND_TARGET_DPI = 200
+
+
+def _background_asset(path, page_width_mm=None, page_height_mm=None):
+    """
+    Return the background ready for pdf.image(): a cached, pre-decoded PIL
+    image when possible, or the plain path when Pillow cannot decode the file.
+    Oversized sources are downscaled once to the page size at the target DPI.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return path
+    key = (path, st.st_mtime_ns, st.st_size, page_width_mm, page_height_mm)
+    cached = _BACKGROUND_CACHE.get(key)
+    if cached is None:
+        cached = path
+        if Image is not None:
+            try:
+                decoded = Image.open(path)
+                decoded.load()
+                if page_width_mm and page_height_mm:
+                    target = (
+                        int(page_width_mm / 25.4 * _BACKGROUND_TARGET_DPI),
+                        int(page_height_mm / 25.4 * _BACKGROUND_TARGET_DPI),
+                    )
+                    if decoded.width > target[0] or decoded.height > target[1]:
+                        if decoded.mode not in ("RGB", "RGBA", "L"):
+                            decoded = decoded.convert("RGB")
+                        decoded = decoded.resize(target, Image.LANCZOS)
+                cached = decoded
+            except Exception:
+                logging.debug("Could not pre-decode background %s; fpdf will read it from disk.", path, exc_info=True)
+        _BACKGROUND_CACHE.clear()  # configs reference one background at a time
+        _BACKGROUND_CACHE[key] = cached
+    return cached
+
+
+# The output directory only needs to be created once per process.
+_CERTIFICATES_DIR_READY = False
+
+
+def _force_regenerate():
+    """True when CERTGEN_FORCE asks to regenerate certificates that already exist."""
+    return os.environ.get("CERTGEN_FORCE", "").strip().lower() in ("1", "true", "t", "yes")
+
+# Name-styling scalars parsed once per config object. The resolve_* helpers
+# below all read from this cache, so the parsing, fallback and warning rules
+# live in one place while repeat calls for the same config cost a dict read.
+# Invalid values are parsed to None here (with a one-time warning); each
+# helper decides its own fallback, including resolve_name_style's raise for
+# a missing font_size.
+_RESOLVED_STYLE_CACHE = None
+
+
+def _resolved_style(config):
+    global _RESOLVED_STYLE_CACHE
+    if _RESOLVED_STYLE_CACHE is not None and _RESOLVED_STYLE_CACHE[0] is config:
+        return _RESOLVED_STYLE_CACHE[1]
+
+    base_font_size = _safe_float(config.get("font_size"))
+
+    long_threshold_raw = config.get("long_name_threshold")
+    long_threshold = _safe_int(long_threshold_raw)
+    if long_threshold_raw is not None and long_threshold is None:
+        logging.warning("Invalid long_name_threshold value '%s'; expected integer.", long_threshold_raw)
+
+    split_threshold_raw = config.get("split_name_threshold", 24)
+    split_threshold = _safe_int(split_threshold_raw)
+    if split_threshold is None:
+        logging.warning(
+            "Invalid split_name_threshold value '%s'; expected integer. Skipping multi-line splits.",
+            split_threshold_raw,
+        )
+
+    split_font_size_raw = config.get("split_name_font_size")
+    split_font_size = _safe_float(split_font_size_raw)
+    if split_font_size_raw is not None and split_font_size is None:
+        logging.warning("Invalid split_name_font_size value '%s'; using the resolved font size.", split_font_size_raw)
+
+    split_text_y_raw = config.get("split_name_text_y")
+    split_text_y = _safe_float(split_text_y_raw)
+    if split_text_y_raw is not None and split_text_y is None:
+        logging.warning("Invalid split_name_text_y value '%s'; using the resolved baseline.", split_text_y_raw)
+
+    text_y_raw = config.get("text_y")
+    text_y = _safe_float(text_y_raw)
+    if text_y_raw is not None and text_y is None:
+        logging.warning("Invalid text_y value in content config: %s", text_y_raw)
+
+    long_text_y_raw = config.get("long_name_text_y", text_y_raw)
+    long_text_y = _safe_float(long_text_y_raw)
+    if long_text_y_raw is not None and long_text_y is None:
+        logging.warning("Invalid long_name_text_y value in content config: %s", long_text_y_raw)
+
+    style = {
+        "orientation": str(config.get("orientation", "L")).upper(),
+        "rgb": parse_hex_color(config.get("text_color")),
+        "base_font_size": base_font_size,
+        "text_y": text_y,
+        "long_threshold": long_threshold,
+        "long_font_size": _safe_float(config.get("long_name_font_size")),
+        "long_text_y": long_text_y,
+        "split_threshold": split_threshold,
+        "split_gap": _safe_float(config.get("split_name_line_gap")),
+        "split_font_size": split_font_size,
+        "split_text_y": split_text_y,
+    }
+    _RESOLVED_STYLE_CACHE = (config, style)
+    return style
+
+# The custom-field layout never changes between rows; parse it from the
+# config dict once and reuse the result for every certificate in the batch.
+_CUSTOM_FIELDS_CACHE = None
+
+
+def _cached_custom_field_configs(config):
+    global _CUSTOM_FIELDS_CACHE
+    if _CUSTOM_FIELDS_CACHE is not None and _CUSTOM_FIELDS_CACHE[0] is config:
+        return _CUSTOM_FIELDS_CACHE[1]
+    fields = get_custom_field_configs(config)
+    _CUSTOM_FIELDS_CACHE = (config, fields)
+    return fields
+
+
+def generate_certificate(name, surname, email, custom_field_values=None, force=False):
+    filename = f"./certificates/{name}_{surname}.pdf"
+    if not force and not _force_regenerate() and os.path.exists(filename):
+        # Rerun after a partial failure: the certificate is already on disk,
+        # so skip the whole render instead of regenerating it.
+        logging.info("Certificate already exists for %s; skipping regeneration", email)
+        return filename
+
     if custom_field_values is None:
         custom_field_values = {}
 
-    orientation = content_config.get("orientation", "L").upper()
-    pdf = FPDF(orientation=orientation, unit="mm", format="A4")
+    config = content_config
+    style = _resolved_style(config)
+    pdf = FPDF(orientation=style["orientation"], unit="mm", format="A4")
+    # The content stream is a few hundred bytes of text operators and the
+    # background is embedded from its already-compressed source data, so the
+    # default DEFLATE pass on output() costs CPU without shrinking anything.
+    pdf.compress = False
     pdf.set_auto_page_break(auto=False)
     pdf.set_margins(0, 0, 0)
     pdf.add_page()
     page_width, page_height = pdf.w, pdf.h
 
-    background_image = content_config["background_image"]
-    if not os.path.exists(background_image):
-        logging.error("Background image not found at %s while creating certificate for %s", background_image, email)
-        raise FileNotFoundError(f"Background image not found: {background_image}")
-    pdf.image(background_image, x=0, y=0, w=page_width, h=page_height)
+    background_image = config["background_image"]
+    _ensure_asset_exists(background_image, "Background image", email)
+    pdf.image(_background_asset(background_image, page_width, page_height), x=0, y=0, w=page_width, h=page_height)
 
-    font_path = content_config["font_path"]
-    if not os.path.exists(font_path):
-        logging.error("Font file not found at %s while creating certificate for %s", font_path, email)
-        raise FileNotFoundError(f"Font file not found: {font_path}")
+    font_path = config["font_path"]
+    _ensure_asset_exists(font_path, "Font file", email)
     pdf.add_font("MyFont", "", font_path)
 
     full_name = f"{name} {surname}"
     first_line = name.strip()
     second_line = surname.strip()
     use_split = (
-        should_split_full_name(full_name, content_config)
+        should_split_full_name(full_name, config)
         and bool(first_line)
         and bool(second_line)
     )
 
-    font_size_pt, text_y_override = resolve_name_style(full_name, content_config)
+    font_size_pt, text_y_override = resolve_name_style(full_name, config)
     if use_split:
-        font_size_pt, text_y_override = resolve_split_style(font_size_pt, text_y_override, content_config)
+        font_size_pt, text_y_override = resolve_split_style(font_size_pt, text_y_override, config)
 
     pdf.set_font("MyFont", "", font_size_pt)
-    apply_text_color(pdf, content_config.get("text_color"))
+    if style["rgb"]:
+        pdf.set_text_color(*style["rgb"])
     baseline_config = {"font_size": font_size_pt, "text_y": text_y_override}
     baseline_y = resolve_text_baseline(pdf, baseline_config)
     if use_split:
-        gap = resolve_split_line_gap(pdf, content_config)
+        gap = resolve_split_line_gap(pdf, config)
         first_line_y = baseline_y - gap
         if first_line:
             first_x = calculate_text_center(pdf, first_line, page_width)
@@ -362,7 +559,7 @@ def generate_certificate(name, surname, email, custom_field_values=None):
         name_x = calculate_text_center(pdf, full_name, page_width)
         pdf.text(name_x, baseline_y, full_name)
 
-    for field_config in get_custom_field_configs(content_config):
+    for field_config in _cached_custom_field_configs(config):
         draw_custom_field_text(
             pdf,
             page_width,
@@ -371,14 +568,73 @@ def generate_certificate(name, surname, email, custom_field_values=None):
             normalize_optional_text(custom_field_values.get(field_config["name"], "")),
         )
 
-    filename = f"./certificates/{name}_{surname}.pdf"
-    os.makedirs("certificates", exist_ok=True)
+    global _CERTIFICATES_DIR_READY
+    if not _CERTIFICATES_DIR_READY:
+        os.makedirs("certificates", exist_ok=True)
+        _CERTIFICATES_DIR_READY = True
 
     pdf.output(filename)
+    # The rendered page buffers are dead weight once the file is written;
+    # dropping them now keeps batch RSS bounded instead of waiting for the
+    # cycle collector to reach each finished FPDF instance.
+    pages = getattr(pdf, "pages", None)
+    if hasattr(pages, "clear"):
+        pages.clear()
     logging.info(f"generated certificate for {email}")
     return filename
 
 
+# Body template split on the {name} placeholder once per template, so each
+# recipient only pays for a str.join instead of str.format's field parser.
+_BODY_TEMPLATE_CACHE = None
+
+
+def _render_body(template, name):
+    global _BODY_TEMPLATE_CACHE
+    cache = _BODY_TEMPLATE_CACHE
+    if cache is None or cache[0] != template:
+        # Escaped braces need format()'s full parser (marked by parts=None);
+        # plain templates are pre-split on {name} so later renders are a
+        # single str.join. Either decision is made once per template.
+        parts = None if ("{{" in template or "}}" in template) else template.split("{name}")
+        cache = _BODY_TEMPLATE_CACHE = (template, parts)
+    parts = cache[1]
+    if parts is None:
+        return template.format(name=name)
+    return name.join(parts)
+
+
+# Fully built attachment part for the most recent PDF, keyed on its stat
+# signature; mailing the same file to several recipients (organizer copies,
+# digest reruns) then skips the re-read and re-base64 pass.
+_ATTACHMENT_CACHE = {}
+
+
+def _build_attachment_part(attachment_path):
+    filename = os.path.basename(attachment_path)  # Get the file name (e.g., "certificate.pdf")
+    try:
+        st = os.stat(attachment_path)
+        key = (attachment_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None:
+        cached = _ATTACHMENT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    # MIMEApplication base64-encodes the payload in its constructor, so no
+    # extra encoders.encode_base64() pass is needed (the old explicit call
+    # re-encoded the already-encoded payload a second time).
+    with open(attachment_path, "rb") as attachment_file:
+        part = MIMEApplication(attachment_file.read(), _subtype="pdf")
+    part.add_header('Content-Disposition', 'attachment', filename=filename)
+
+    if key is not None:
+        _ATTACHMENT_CACHE.clear()  # each batch mails one file at a time
+        _ATTACHMENT_CACHE[key] = part
+    return part
+
+
 def prepare_email_content(receiver_email, name, attachment_path):
     # Create the MIMEMultipart message
     msg = MIMEMultipart()
@@ -388,26 +644,83 @@ def prepare_email_content(receiver_email, name, attachment_path):
 
 
     # Email body
-    body = email_config["body"].format(name=name)
+    body = _render_body(email_config["body"], name)
     msg.attach(MIMEText(body, "html"))
 
-    filename = os.path.basename(attachment_path)  # Get the file name (e.g., "certificate.pdf")
-    part = MIMEApplication(open(attachment_path, "rb").read())
-    part.add_header('Content-Disposition', 'attachment', filename=filename)
-
-    # Encode the file in base64 to send it over email
-    encoders.encode_base64(part)
-    msg.attach(part)
+    # The part is never mutated after construction, so sharing one instance
+    # across messages for the same file is safe.
+    msg.attach(_build_attachment_part(attachment_path))
     return msg
 
-def send_email(receiver_email, msg):
+class SmtpSession:
+    """
+    Authenticated SMTP connection reused for a whole batch of emails.
+    Opening, securing and logging into the server once avoids paying the
+    TLS handshake and AUTH round-trips for every single recipient.
+    """
+
+    # Rotate the connection periodically so providers with per-connection
+    # message caps do not drop the session mid-batch.
+    max_messages_per_connection = 100
+
+    def __init__(self, server, port, sender, password):
+        self.server = server
+        self.port = port
+        self.sender = sender
+        self.password = password
+        self._client = None
+        self._sent_on_connection = 0
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def connect(self):
+        client = smtplib.SMTP(self.server, self.port)
+        client.starttls()  # Secure the connection
+        client.login(self.sender, self.password)  # Log into the SMTP server
+        self._client = client
+        self._sent_on_connection = 0
+
+    def close(self):
+        if self._client is None:
+            return
+        try:
+            self._client.quit()
+        except Exception:
+            logging.debug("Ignoring error while closing SMTP session", exc_info=True)
+        self._client = None
+
+    def send(self, receiver_email, message):
+        if self._client is None or self._sent_on_connection >= self.max_messages_per_connection:
+            self.close()
+            self.connect()
+        try:
+            self._client.sendmail(self.sender, receiver_email, message)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection; reconnect and retry once.
+            self.connect()
+            self._client.sendmail(self.sender, receiver_email, message)
+        self._sent_on_connection += 1
+
+
+def send_email(receiver_email, msg, session=None):
     try:
-        # Establish a connection to the SMTP server and send the email
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()  # Secure the connection
-        server.login(email_sender, email_password)  # Log into the SMTP server
-        server.sendmail(email_sender, receiver_email, msg.as_string())  # Send the email
-        server.quit()  # Logout and close the connection
+        if session is not None:
+            # Reuse the already-authenticated batch connection. as_bytes()
+            # serializes the message once without the extra str round-trip
+            # that as_string() adds before smtplib re-encodes it anyway.
+            session.send(receiver_email, msg.as_bytes())
+        else:
+            # Establish a connection to the SMTP server and send the email
+            server = smtplib.SMTP(smtp_server, smtp_port)
+            server.starttls()  # Secure the connection
+            server.login(email_sender, email_password)  # Log into the SMTP server
+            server.sendmail(email_sender, receiver_email, msg.as_string())  # Send the email
+            server.quit()  # Logout and close the connection
 
         # Log the success
         logging.info(f"E-mail sent to: {receiver_email}")
@@ -419,8 +732,17 @@ def send_email(receiver_email, msg):
 
 # Load data from the CSV and generate certificates
 def process_csv(file_path, debug_mode_label, should_send_email):
-    data = pd.read_csv(file_path)
-    total = len(data.index)
+    # The participant file is a handful of plain string columns, so the
+    # stdlib csv reader parses it straight into the record dicts the rest
+    # of the pipeline consumes — no DataFrame construction and no dtype
+    # inference. The whole file is read into one record list up front:
+    # progress totals, the digest ZIP and the pool map all need the full
+    # row set anyway, and a row is just a small dict of short strings.
+    with open(file_path, newline="", encoding="utf-8-sig") as csv_file:
+        reader = csv.DictReader(csv_file)
+        columns = reader.fieldnames or []
+        records = list(reader)
+    total = len(records)
 
     if total == 0:
         logging.warning("No participants found in %s", file_path)
@@ -428,7 +750,7 @@ def process_csv(file_path, debug_mode_label, should_send_email):
 
     print(f"Debug Mode: {debug_mode_label}")
     custom_field_configs = get_custom_field_configs(content_config)
-    available_columns = set(data.columns)
+    available_columns = set(columns)
     missing_custom_columns = [
         field_config["name"] for field_config in custom_field_configs if field_config["name"] not in available_columns
     ]
@@ -436,49 +758,193 @@ def process_csv(file_path, debug_mode_label, should_send_email):
     if missing_custom_columns:
         warning_message = (
             f"CSV is missing configured custom field columns: {', '.join(missing_custom_columns)}. "
-            f"Available columns: {', '.join(str(column) for column in data.columns)}"
+            f"Available columns: {', '.join(str(column) for column in columns)}"
         )
         logging.warning(warning_message)
         print(f"Warning: {warning_message}")
 
-    for position, (_, row) in enumerate(data.iterrows(), start=1):
-        name = normalize_optional_text(row["FirstName"])
-        surname = normalize_optional_text(row["LastName"])
-        receiver_email = normalize_optional_text(row["Email"])
-        custom_field_values = {
-            field_config["name"]: normalize_optional_text(row.get(field_config["name"], ""))
-            for field_config in custom_field_configs
-        }
-
-        # Backward compatibility for older CSV files that still use a single `Additional` column.
-        if "Additional" in available_columns and custom_field_configs:
-            first_field_name = custom_field_configs[0]["name"]
-            if not custom_field_values.get(first_field_name):
-                custom_field_values[first_field_name] = normalize_optional_text(row.get("Additional", ""))
-
-        missing_fields_for_email = [
-            field_config["name"]
-            for field_config in custom_field_configs
-            if not normalize_optional_text(custom_field_values.get(field_config["name"], ""))
+    # Digest mode: generate everything, then send one email with a ZIP of all
+    # certificates to the configured organizer instead of one email per row.
+    digest_to = email_config.get("digest_to") if should_send_email else None
+
+    smtp_session = (
+        SmtpSession(smtp_server, smtp_port, email_sender, email_password)
+        if should_send_email
+        else None
+    )
+    try:
+        _process_rows(records, total, custom_field_configs, available_columns, should_send_email, smtp_session, digest_to)
+    finally:
+        if smtp_session is not None:
+            smtp_session.close()
+
+
+def _extract_row(row, custom_field_configs, available_columns):
+    name = normalize_optional_text(row["FirstName"])
+    surname = normalize_optional_text(row["LastName"])
+    receiver_email = normalize_optional_text(row["Email"])
+    custom_field_values = {
+        field_config["name"]: normalize_optional_text(row.get(field_config["name"], ""))
+        for field_config in custom_field_configs
+    }
+
+    # Backward compatibility for older CSV files that still use a single `Additional` column.
+    if "Additional" in available_columns and custom_field_configs:
+        first_field_name = custom_field_configs[0]["name"]
+        if not custom_field_values.get(first_field_name):
+            custom_field_values[first_field_name] = normalize_optional_text(row.get("Additional", ""))
+
+    missing_fields_for_email = [
+        field_config["name"]
+        for field_config in custom_field_configs
+        if not custom_field_values.get(field_config["name"])
+    ]
+    if missing_fields_for_email:
+        per_email_warning = f"{receiver_email} is missing {', '.join(missing_fields_for_email)}"
+        logging.warning(per_email_warning)
+        print(per_email_warning)
+
+    return name, surname, receiver_email, custom_field_values
+
+
+def _log_progress(position, total, in_place=False):
+    # Report roughly every 1% (at least every row for small batches) plus the
+    # final row, instead of formatting and flushing a line per certificate.
+    step = total // 100 or 1
+    if position % step and position != total:
+        return
+    percent = (position / total) * 100
+    logging.info("Progress: %d/%d (%.1f%%) certificates prepared", position, total, percent)
+    if in_place:
+        # Batch runs print nothing else, so rewrite a single status line
+        # instead of scrolling one line per report.
+        sys.stdout.write(f"\rProgress: {position}/{total} ({percent:.1f}%) certificates prepared")
+        if position == total:
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+    else:
+        print(f"Progress: {position}/{total} ({percent:.1f}%) certificates prepared")
+
+
+# Shared read-only mapping for rows without custom fields.
+_NO_CUSTOM_FIELDS = {}
+
+
+def _pool_initializer(config):
+    """Install the content configuration in a pool worker process."""
+    global content_config
+    content_config = config
+
+
+def _certificate_job(args):
+    """Top-level wrapper so certificate jobs can be pickled to pool workers."""
+    (name, surname, receiver_email, custom_field_values), force = args
+    return generate_certificate(name, surname, receiver_email, custom_field_values, force=force)
+
+
+def _prepare_digest_email(digest_to, pdf_paths):
+    """Build the single digest message bundling every certificate as a ZIP."""
+    archive = io.BytesIO()
+    # ZIP_STORED: the PDFs are already compressed, so DEFLATE would burn CPU
+    # for no size gain.
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as bundle:
+        for pdf_path in pdf_paths:
+            bundle.write(pdf_path, arcname=os.path.basename(pdf_path))
+
+    msg = MIMEMultipart()
+    msg['From'] = formataddr(("Eletive", email_sender))
+    msg["To"] = digest_to
+    msg["Subject"] = email_config.get("digest_subject", email_config["subject"])
+    body_template = email_config.get("digest_body", "<p>{count} certificates attached.</p>")
+    msg.attach(MIMEText(body_template.format(count=len(pdf_paths)), "html"))
+
+    part = MIMEApplication(archive.getvalue(), _subtype="zip")
+    part.add_header('Content-Disposition', 'attachment', filename="certificates.zip")
+    msg.attach(part)
+    return msg
+
+
+def _process_rows(records, total, custom_field_configs, available_columns, should_send_email, smtp_session, digest_to=None):
+    # records are the plain per-row dicts read from the participants CSV.
+    if not custom_field_configs and "Additional" not in available_columns:
+        # Nothing beyond the three required columns is read, so skip the
+        # per-row custom-field bookkeeping in _extract_row. The empty
+        # custom-fields mapping is read-only downstream, so one shared
+        # instance serves every row instead of a fresh dict each.
+        rows = [
+            (
+                normalize_optional_text(record["FirstName"]),
+                normalize_optional_text(record["LastName"]),
+                normalize_optional_text(record["Email"]),
+                _NO_CUSTOM_FIELDS,
+            )
+            for record in records
+        ]
+    else:
+        rows = [
+            _extract_row(record, custom_field_configs, available_columns)
+            for record in records
         ]
-        if missing_fields_for_email:
-            per_email_warning = f"{receiver_email} is missing {', '.join(missing_fields_for_email)}"
-            logging.warning(per_email_warning)
-            print(per_email_warning)
-
-        pdf_path = generate_certificate(name, surname, receiver_email, custom_field_values)
-        logging.info(
-            "Progress: %d/%d (%.1f%%) certificates prepared",
-            position,
-            total,
-            (position / total) * 100,
-        )
-        print(f"Progress: {position}/{total} ({(position / total) * 100:.1f}%) certificates prepared")
 
-        if should_send_email:
-            print(f"Sending email to: {receiver_email}")
-            msg = prepare_email_content(receiver_email, name, pdf_path)
-            send_email(receiver_email, msg)
+    # Rows that share a first+last name map to the same certificate filename,
+    # so the exists-on-disk skip in generate_certificate would silently hand
+    # every later duplicate the first row's PDF (wrong custom-field values).
+    # Track the names seen in this batch and force regeneration for repeats;
+    # in per-recipient mode each row's email is assembled right after its own
+    # render, before the next duplicate overwrites the file.
+    seen_names = {}
+    force_flags = []
+    for name, surname, receiver_email, _ in rows:
+        name_key = (name, surname)
+        duplicate = name_key in seen_names
+        if duplicate:
+            logging.warning(
+                "Participants %s and %s share the certificate filename for '%s %s'; regenerating it per row.",
+                seen_names[name_key],
+                receiver_email,
+                name,
+                surname,
+            )
+        else:
+            seen_names[name_key] = receiver_email
+        force_flags.append(duplicate)
+
+    # CERTGEN_WORKERS caps the pool size; setting it to 1 forces the
+    # sequential path (useful for debugging and constrained machines).
+    workers = _safe_int(os.environ.get("CERTGEN_WORKERS"))
+    use_pool = total > 1 and (not should_send_email or digest_to) and (workers is None or workers > 1)
+
+    if use_pool:
+        # Runs without per-row sends are CPU-bound in fpdf2 (font subsetting
+        # plus stream assembly), so fan the rows out across worker processes.
+        # Per-recipient email mode stays sequential: each row's send reuses
+        # the shared SMTP session right after its certificate is produced.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_pool_initializer, initargs=(content_config,)) as pool:
+            pdf_paths = []
+            for position, pdf_path in enumerate(pool.map(_certificate_job, zip(rows, force_flags), chunksize=16), start=1):
+                _log_progress(position, total, in_place=True)
+                pdf_paths.append(pdf_path)
+    else:
+        pdf_paths = []
+        for position, ((name, surname, receiver_email, custom_field_values), force) in enumerate(zip(rows, force_flags), start=1):
+            pdf_path = generate_certificate(name, surname, receiver_email, custom_field_values, force=force)
+            _log_progress(position, total)
+            pdf_paths.append(pdf_path)
+
+            if should_send_email and not digest_to:
+                print(f"Sending email to: {receiver_email}")
+                msg = prepare_email_content(receiver_email, name, pdf_path)
+                send_email(receiver_email, msg, smtp_session)
+
+            if position % 256 == 0:
+                # Finished FPDF/MIME objects sit in reference cycles; a
+                # periodic collection keeps long batches from accumulating
+                # them until the threshold-based GC eventually runs.
+                gc.collect()
+
+    if digest_to:
+        print(f"Sending digest email to: {digest_to}")
+        send_email(digest_to, _prepare_digest_email(digest_to, pdf_paths), smtp_session)
 
 def main():
     global content_config
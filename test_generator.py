@@ -10,42 +10,26 @@ if "pandas" not in sys.modules:
 if "fpdf" not in sys.modules:
     fpdf_stub = types.ModuleType("fpdf")
 
-    class _DummyFPDF:
-        def __init__(self, *args, **kwargs):
-            self.font_size = float(kwargs.get("size", 0) or 0)
+    def _make_fake_fpdf(*args, **kwargs):
+        pdf = types.SimpleNamespace(font_size=float(kwargs.get("size", 0) or 0))
 
-        def set_auto_page_break(self, *args, **kwargs):
-            pass
+        def _noop(*noop_args, **noop_kwargs):
+            return None
 
-        def set_margins(self, *args, **kwargs):
-            pass
-
-        def add_page(self, *args, **kwargs):
-            pass
-
-        def add_font(self, *args, **kwargs):
-            pass
-
-        def set_font(self, *args, **kwargs):
-            size = kwargs.get("size")
-            if size is None and len(args) >= 2:
-                size = args[1]
+        def _set_font(*font_args, **font_kwargs):
+            size = font_kwargs.get("size")
+            if size is None and len(font_args) >= 2:
+                size = font_args[1]
             if size is not None:
-                self.font_size = float(size)
-
-        def image(self, *args, **kwargs):
-            pass
-
-        def text(self, *args, **kwargs):
-            pass
-
-        def get_string_width(self, text):
-            return float(len(text))
+                pdf.font_size = float(size)
 
-        def output(self, *args, **kwargs):
-            pass
+        for method in ("set_auto_page_break", "set_margins", "add_page", "add_font", "image", "text", "output"):
+            setattr(pdf, method, _noop)
+        pdf.set_font = _set_font
+        pdf.get_string_width = lambda text: float(len(text))
+        return pdf
 
-    fpdf_stub.FPDF = _DummyFPDF
+    fpdf_stub.FPDF = _make_fake_fpdf
     sys.modules["fpdf"] = fpdf_stub
 
 from generator import (
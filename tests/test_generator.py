@@ -1,5 +1,7 @@
 import json
 import logging
+import types
+from email.utils import formataddr
 
 import pandas as pd
 import pytest
@@ -28,6 +30,26 @@ def test_load_config_merges_files(tmp_path):
     assert merged == {"a": 1, "shared": "override", "b": 2}
 
 
+def test_load_config_caches_by_mtime(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"a": 1}), encoding="utf-8")
+
+    calls = {"parse": 0}
+    real_loads = generator._json_loads
+
+    def counting_loads(payload):
+        calls["parse"] += 1
+        return real_loads(payload)
+
+    monkeypatch.setattr(generator, "_json_loads", counting_loads)
+
+    first = generator.load_config([config_file])
+    second = generator.load_config([config_file])
+
+    assert first == second == {"a": 1}
+    assert calls["parse"] == 1
+
+
 @pytest.mark.parametrize(
     "raw_value,expected_label,should_send",
     [
@@ -62,6 +84,27 @@ def test_calculate_text_center():
     assert position == pytest.approx(48)
 
 
+def test_calculate_text_center_memoizes_widths():
+    class DummyPDF:
+        font_family = "MyFont"
+        font_size_pt = 32
+
+        def __init__(self):
+            self.calls = 0
+
+        def get_string_width(self, text):
+            self.calls += 1
+            return len(text)
+
+    generator._STRING_WIDTH_CACHE.clear()
+    pdf = DummyPDF()
+    first = generator.calculate_text_center(pdf, "Ada Lovelace", page_width=100)
+    second = generator.calculate_text_center(pdf, "Ada Lovelace", page_width=100)
+
+    assert first == second
+    assert pdf.calls == 1
+
+
 def test_generate_certificate_creates_expected_pdf(monkeypatch, tmp_config_files):
     background, font_file = tmp_config_files
 
@@ -148,6 +191,113 @@ def test_generate_certificate_creates_expected_pdf(monkeypatch, tmp_config_files
     assert pdf.output_file == "./certificates/Ada_Lovelace.pdf"
 
 
+class QuietPDF:
+    """Minimal no-assert FPDF stand-in for tests that only exercise flow."""
+
+    def __init__(self, orientation, unit, format):
+        self.w, self.h = (297, 210) if orientation == "L" else (210, 297)
+        self.font_size = 0
+
+    def set_auto_page_break(self, auto):
+        pass
+
+    def set_margins(self, left, top, right):
+        pass
+
+    def add_page(self):
+        pass
+
+    def image(self, path, x, y, w, h):
+        pass
+
+    def add_font(self, name, style, path):
+        pass
+
+    def set_font(self, name, style, size):
+        self.font_size = size
+
+    def get_string_width(self, text):
+        return len(text)
+
+    def text(self, x, y, txt):
+        pass
+
+    def output(self, filename):
+        return filename
+
+
+def test_generate_certificate_makedirs_once(monkeypatch, tmp_config_files):
+    background, font_file = tmp_config_files
+
+    monkeypatch.setattr(
+        generator,
+        "content_config",
+        {
+            "orientation": "L",
+            "background_image": str(background),
+            "font_path": str(font_file),
+            "font_size": 32,
+            "text_y": 107,
+        },
+        raising=False,
+    )
+
+    makedirs_calls = []
+    monkeypatch.setattr(generator.os, "makedirs", lambda path, exist_ok: makedirs_calls.append(path))
+    monkeypatch.setattr(generator, "FPDF", QuietPDF)
+    monkeypatch.setattr(generator, "_CERTIFICATES_DIR_READY", False)
+
+    generator.generate_certificate("Ada", "Lovelace", "ada@example.com")
+    generator.generate_certificate("Grace", "Hopper", "grace@example.com")
+
+    assert makedirs_calls == ["certificates"]
+
+
+def test_background_asset_decodes_once(monkeypatch, tmp_path):
+    background = tmp_path / "bg.png"
+    background.write_bytes(b"fake image content")
+
+    opens = []
+
+    class FakeImage:
+        width = 10
+        height = 10
+        mode = "RGB"
+
+        def load(self):
+            pass
+
+    fake_module = types.SimpleNamespace(
+        open=lambda path: opens.append(path) or FakeImage(),
+        LANCZOS=1,
+    )
+    monkeypatch.setattr(generator, "Image", fake_module)
+    generator._BACKGROUND_CACHE.clear()
+
+    first = generator._background_asset(str(background), 297, 210)
+    second = generator._background_asset(str(background), 297, 210)
+
+    assert len(opens) == 1
+    assert first is second
+
+
+def test_generate_certificate_skips_existing_file(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    certificates_dir = tmp_path / "certificates"
+    certificates_dir.mkdir()
+    (certificates_dir / "Ada_Lovelace.pdf").write_bytes(b"already generated")
+
+    class ExplodingPDF:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("FPDF should not be constructed for an existing certificate")
+
+    monkeypatch.setattr(generator, "FPDF", ExplodingPDF)
+
+    result = generator.generate_certificate("Ada", "Lovelace", "ada@example.com")
+
+    assert result == "./certificates/Ada_Lovelace.pdf"
+
+
 def test_generate_certificate_raises_when_background_missing(monkeypatch, tmp_path):
     font_file = tmp_path / "font.ttf"
     font_file.write_text("fake", encoding="utf-8")
@@ -238,7 +388,7 @@ def test_prepare_email_content_builds_message(monkeypatch, tmp_path):
 
     msg = generator.prepare_email_content("ada@example.com", "Ada", str(attachment))
 
-    assert msg["From"] == "sender@example.com"
+    assert msg["From"] == formataddr(("Eletive", "sender@example.com"))
     assert msg["To"] == "ada@example.com"
     assert msg["Subject"] == "Certificate"
     payloads = msg.get_payload()
@@ -296,6 +446,60 @@ def test_send_email_uses_smtp(monkeypatch):
     assert client.quit_called
 
 
+def test_render_body_reuses_split_template():
+    generator._BODY_TEMPLATE_CACHE = None
+    template = "<p>Hello {name}</p>"
+
+    assert generator._render_body(template, "Ada") == "<p>Hello Ada</p>"
+    cached = generator._BODY_TEMPLATE_CACHE
+    assert cached is not None
+
+    assert generator._render_body(template, "Grace") == "<p>Hello Grace</p>"
+    assert generator._BODY_TEMPLATE_CACHE is cached
+
+    escaped = "<p>{{literal}} {name}</p>"
+    assert generator._render_body(escaped, "Ada") == "<p>{literal} Ada</p>"
+
+
+def test_smtp_session_reuses_connection(monkeypatch):
+    class DummySMTP:
+        instances = []
+
+        def __init__(self, host, port):
+            self.host = host
+            self.port = port
+            self.starttls_calls = 0
+            self.login_calls = 0
+            self.sent = []
+            self.quit_called = False
+            DummySMTP.instances.append(self)
+
+        def starttls(self):
+            self.starttls_calls += 1
+
+        def login(self, user, password):
+            self.login_calls += 1
+
+        def sendmail(self, sender, receiver, message):
+            self.sent.append((sender, receiver, message))
+
+        def quit(self):
+            self.quit_called = True
+
+    monkeypatch.setattr(generator.smtplib, "SMTP", DummySMTP)
+
+    with generator.SmtpSession("smtp.example.com", 587, "sender@example.com", "secret") as session:
+        for index in range(3):
+            session.send(f"user{index}@example.com", f"raw-{index}")
+
+    assert len(DummySMTP.instances) == 1
+    client = DummySMTP.instances[0]
+    assert client.starttls_calls == 1
+    assert client.login_calls == 1
+    assert len(client.sent) == 3
+    assert client.quit_called
+
+
 def test_send_email_logs_errors(caplog, monkeypatch):
     def failing_smtp(*_, **__):
         raise RuntimeError("SMTP offline")
@@ -326,6 +530,49 @@ def build_participant_csv(tmp_path, rows):
     return csv_path
 
 
+def test_process_rows_skips_email_assembly_when_not_sending(monkeypatch):
+    monkeypatch.setenv("CERTGEN_WORKERS", "1")
+    generated = []
+    monkeypatch.setattr(generator, "generate_certificate", lambda *args, **kwargs: generated.append(args) or "out.pdf")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("email assembly must not run when sending is disabled")
+
+    monkeypatch.setattr(generator, "prepare_email_content", fail)
+    monkeypatch.setattr(generator, "send_email", fail)
+
+    records = [
+        {"FirstName": "Ada", "LastName": "Lovelace", "Email": "ada@example.com"},
+        {"FirstName": "Grace", "LastName": "Hopper", "Email": "grace@example.com"},
+    ]
+    generator._process_rows(records, 2, [], {"FirstName", "LastName", "Email"}, False, None)
+
+    assert len(generated) == 2
+
+
+def test_process_rows_forces_regeneration_for_duplicate_names(monkeypatch, caplog):
+    monkeypatch.setenv("CERTGEN_WORKERS", "1")
+    calls = []
+
+    def fake_generate(name, surname, email, custom_field_values=None, force=False):
+        calls.append((email, force))
+        return "out.pdf"
+
+    monkeypatch.setattr(generator, "generate_certificate", fake_generate)
+    monkeypatch.setattr(generator, "prepare_email_content", lambda *args, **kwargs: None)
+    monkeypatch.setattr(generator, "send_email", lambda *args, **kwargs: None)
+
+    records = [
+        {"FirstName": "Ada", "LastName": "Lovelace", "Email": "ada@example.com"},
+        {"FirstName": "Ada", "LastName": "Lovelace", "Email": "ada.l@example.com"},
+    ]
+    with caplog.at_level(logging.WARNING):
+        generator._process_rows(records, 2, [], {"FirstName", "LastName", "Email"}, False, None)
+
+    assert calls == [("ada@example.com", False), ("ada.l@example.com", True)]
+    assert "share the certificate filename" in caplog.text
+
+
 def test_process_csv_handles_empty_file(tmp_path, caplog, monkeypatch):
     csv_path = build_participant_csv(tmp_path, [])
 
@@ -355,9 +602,12 @@ def test_process_csv_generates_without_sending(tmp_path, capsys, monkeypatch):
         ],
     )
 
+    monkeypatch.setenv("CERTGEN_WORKERS", "1")
+    monkeypatch.setattr(generator, "content_config", {}, raising=False)
+
     generated = []
 
-    def fake_generate(name, surname, email):
+    def fake_generate(name, surname, email, custom_field_values=None, force=False):
         generated.append((name, surname, email))
         return str(tmp_path / f"{name}_{surname}.pdf")
 
@@ -388,6 +638,14 @@ def test_process_csv_sends_emails_when_enabled(tmp_path, monkeypatch):
         ],
     )
 
+    monkeypatch.setenv("CERTGEN_WORKERS", "1")
+    monkeypatch.setattr(generator, "content_config", {}, raising=False)
+    monkeypatch.setattr(generator, "email_config", {}, raising=False)
+    monkeypatch.setattr(generator, "smtp_server", "smtp.example.com", raising=False)
+    monkeypatch.setattr(generator, "smtp_port", 587, raising=False)
+    monkeypatch.setattr(generator, "email_sender", "sender@example.com", raising=False)
+    monkeypatch.setattr(generator, "email_password", "secret", raising=False)
+
     monkeypatch.setattr(generator, "generate_certificate", lambda *_, **__: "certificate.pdf")
 
     prepared_messages = []
@@ -400,7 +658,7 @@ def test_process_csv_sends_emails_when_enabled(tmp_path, monkeypatch):
     monkeypatch.setattr(generator, "prepare_email_content", fake_prepare)
 
     sent_emails = []
-    monkeypatch.setattr(generator, "send_email", lambda receiver, msg: sent_emails.append((receiver, msg)))
+    monkeypatch.setattr(generator, "send_email", lambda receiver, msg, session=None: sent_emails.append((receiver, msg)))
 
     generator.process_csv(csv_path, "Full", True)
 